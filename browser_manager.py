@@ -91,6 +91,10 @@ class BrowserManager:
         
         # Detect default browser
         self.default_browser = self._get_default_browser()
+        
+        # Raw cookie jar from the last successful load, so callers can use it
+        # without decrypting the browser's cookie store again
+        self.last_cookie_jar = None
     
     def get_available_browsers(self) -> List[Dict]:
         """
@@ -226,6 +230,7 @@ class BrowserManager:
         if missing_cookies:
             return False, None, f"Essential cookies missing in {browser_name}: {', '.join(missing_cookies)}"
         
+        self.last_cookie_jar = cookies
         logger.info(f"Successfully loaded {len(cookie_dict)} cookies from {browser_name}")
         return True, cookie_dict, None
     
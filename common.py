@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Common Helpers Module
+
+This module holds the helpers shared by the scraper and the enroller: the
+per-user cache directory, Udemy URL checks and cache file writes.
+"""
+
+import json
+import os
+import tempfile
+from functools import lru_cache
+from urllib.parse import urlparse
+
+# Per-user directory for data kept between runs
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'udemy_enroller')
+
+
+@lru_cache(maxsize=4096)
+def is_udemy_url(url: str) -> bool:
+    """Check that a URL's host is udemy.com or one of its subdomains."""
+    try:
+        host = urlparse(url).hostname or ''
+    except ValueError:
+        # Malformed URL, e.g. an unclosed "[" in the host
+        return False
+    return host == 'udemy.com' or host.endswith('.udemy.com')
+
+
+def write_json_atomic(path: str, data) -> None:
+    """
+    Write JSON to a file so readers never see a partial write.
+
+    The data goes to a temporary file in the same directory which then
+    replaces the target, so concurrent writers leave one complete file.
+    The file is created readable by the owner only (mode 0600).
+
+    Args:
+        path (str): File to write
+        data: JSON-serialisable value
+    """
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with open(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
@@ -17,6 +17,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Patterns for numeric values scraped as text (see _get_numeric_value)
+_RATING_PATTERN = re.compile(r'(\d+\.?\d*)')
+_HOURS_PATTERN = re.compile(r'(\d+\.?\d*)\s*(?:hours?|hrs?|h)', re.IGNORECASE)
+_HOURS_MINUTES_PATTERN = re.compile(r'(\d+)h\s*(\d+)m', re.IGNORECASE)
+_STUDENTS_PATTERN = re.compile(r'([\d,]+)')
+
 
 def filter_courses(
     courses: List[Dict],
@@ -74,6 +80,16 @@ def filter_courses(
     instructors = _ensure_list(instructors)
     exclude_instructors = _ensure_list(exclude_instructors)
     
+    # Case-fold the search terms once here rather than once per course
+    if not case_sensitive:
+        language = language.lower() if language else language
+        keywords = _fold_case(keywords)
+        exclude_keywords = _fold_case(exclude_keywords)
+        categories = _fold_case(categories)
+        exclude_categories = _fold_case(exclude_categories)
+        instructors = _fold_case(instructors)
+        exclude_instructors = _fold_case(exclude_instructors)
+    
     for course in courses:
         # Skip if course doesn't have required fields
         if not isinstance(course, dict) or 'title' not in course:
@@ -147,6 +163,8 @@ def filter_by_language(courses: List[Dict], language: str, case_sensitive: bool
     Returns:
         List[Dict]: Filtered courses
     """
+    if language and not case_sensitive:
+        language = language.lower()
     return [course for course in courses if _passes_language_filter(course, language, case_sensitive)]
 
 
@@ -163,6 +181,8 @@ def filter_by_keywords(courses: List[Dict], keywords: Union[str, List[str]], cas
         List[Dict]: Filtered courses
     """
     keywords = _ensure_list(keywords)
+    if not case_sensitive:
+        keywords = _fold_case(keywords)
     return [course for course in courses if _passes_keyword_filter(course, keywords, [], case_sensitive)]
 
 
@@ -269,6 +289,96 @@ def get_unique_values(courses: List[Dict], field: str) -> List[str]:
     return sorted(list(unique_values))
 
 
+def build_course_columns(courses: List[Dict]) -> Dict[str, List]:
+    """
+    Pre-extract filterable course fields into parallel columns.
+    
+    Parsing ratings and durations (which may be strings such as "4.5 stars"
+    or "2h 30m") is done once here, so repeated calls to
+    filter_course_indices() only compare ready-made values.
+    
+    Args:
+        courses (List[Dict]): List of course dictionaries
+    
+    Returns:
+        Dict: Columns 'valid', 'ratings', 'durations', 'languages', 'titles'
+            (lowercased, for sorting) and 'search_texts' (lowercased title and
+            description), each with one entry per course in the same order
+            as ``courses``
+    """
+    columns = {'valid': [], 'ratings': [], 'durations': [], 'languages': [], 'titles': [], 'search_texts': []}
+    
+    for course in courses:
+        valid = isinstance(course, dict) and 'title' in course
+        columns['valid'].append(valid)
+        columns['ratings'].append(_get_numeric_value(course, 'rating', 0.0) if valid else 0.0)
+        columns['durations'].append(_get_numeric_value(course, 'duration', 0.0) if valid else 0.0)
+        columns['languages'].append((course.get('language') or '').lower() if valid else '')
+        columns['titles'].append((course.get('title') or '').lower() if valid else '')
+        columns['search_texts'].append(
+            f"{course.get('title', '')} {course.get('description', '')}".lower() if valid else ''
+        )
+    
+    return columns
+
+
+def filter_course_indices(
+    columns: Dict[str, List],
+    min_rating: float = 0.0,
+    max_duration: Optional[float] = None,
+    language: Optional[str] = None,
+    keywords: Optional[Union[str, List[str]]] = None
+) -> List[int]:
+    """
+    Filter courses using columns from build_course_columns().
+    
+    Matches filter_courses() for the criteria it supports (case-insensitive).
+    Each active criterion narrows the candidate list in its own tight pass,
+    cheapest checks first, so inactive criteria cost nothing and the
+    keyword scan only sees courses that passed everything else.
+    
+    Args:
+        columns (Dict[str, List]): Result of build_course_columns(courses)
+        min_rating (float): Minimum course rating (0.0 to 5.0)
+        max_duration (float, optional): Maximum duration in hours
+        language (str, optional): Course language filter
+        keywords (str|List[str], optional): Keywords to search for in title/description
+    
+    Returns:
+        List[int]: Indices of the matching courses, in their original order
+    """
+    keywords = [kw.lower() for kw in _ensure_list(keywords)]
+    
+    candidates = [index for index, valid in enumerate(columns['valid']) if valid]
+    
+    if min_rating > 0:
+        ratings = columns['ratings']
+        candidates = [index for index in candidates if ratings[index] >= min_rating]
+    
+    if max_duration is not None:
+        durations = columns['durations']
+        candidates = [index for index in candidates if durations[index] <= max_duration]
+    
+    if language:
+        language = language.lower()
+        languages = columns['languages']
+        candidates = [index for index in candidates if language in languages[index]]
+    
+    if keywords:
+        # One substring pass per keyword over the courses no keyword has
+        # matched yet; plain `in` beats both any() and a compiled alternation
+        texts = columns['search_texts']
+        unmatched = candidates
+        for keyword in keywords:
+            unmatched = [index for index in unmatched if keyword not in texts[index]]
+        
+        if unmatched:
+            unmatched = set(unmatched)
+            candidates = [index for index in candidates if index not in unmatched]
+    
+    return candidates
+
+
 def get_filter_statistics(courses: List[Dict]) -> Dict:
     """
     Get statistics about filterable fields in the course list.
@@ -311,6 +421,11 @@ def _ensure_list(value: Union[str, List[str], None]) -> List[str]:
     return value
 
 
+def _fold_case(values: List[str]) -> List[str]:
+    """Lowercase search terms for case-insensitive matching."""
+    return [value.lower() for value in values]
+
+
 def _get_numeric_value(course: Dict, field: str, default: Union[int, float]) -> Union[int, float]:
     """Extract numeric value from course dictionary."""
     value = course.get(field, default)
@@ -323,19 +438,19 @@ def _get_numeric_value(course: Dict, field: str, default: Union[int, float]) ->
         try:
             # Handle ratings like "4.5" or "4.5 stars"
             if field == 'rating':
-                rating_match = re.search(r'(\d+\.?\d*)', value)
+                rating_match = _RATING_PATTERN.search(value)
                 if rating_match:
                     return float(rating_match.group(1))
             
             # Handle duration like "5.5 hours" or "2h 30m"
             elif field == 'duration':
                 # Pattern for "X hours" or "X.Y hours"
-                hours_match = re.search(r'(\d+\.?\d*)\s*(?:hours?|hrs?|h)', value, re.IGNORECASE)
+                hours_match = _HOURS_PATTERN.search(value)
                 if hours_match:
                     return float(hours_match.group(1))
                 
                 # Pattern for "Xh Ym" format
-                time_match = re.search(r'(\d+)h\s*(\d+)m', value, re.IGNORECASE)
+                time_match = _HOURS_MINUTES_PATTERN.search(value)
                 if time_match:
                     hours = int(time_match.group(1))
                     minutes = int(time_match.group(2))
@@ -343,7 +458,7 @@ def _get_numeric_value(course: Dict, field: str, default: Union[int, float]) ->
             
             # Handle student count like "1,234 students"
             elif field == 'students':
-                students_match = re.search(r'([\d,]+)', value)
+                students_match = _STUDENTS_PATTERN.search(value)
                 if students_match:
                     return int(students_match.group(1).replace(',', ''))
             
@@ -375,7 +490,7 @@ def _passes_duration_filter(course: Dict, max_duration: Optional[float]) -> bool
 
 
 def _passes_language_filter(course: Dict, language: Optional[str], case_sensitive: bool) -> bool:
-    """Check if course passes language filter."""
+    """Check if course passes language filter (search terms pre-folded unless case_sensitive)."""
     if not language:
         return True
     
@@ -383,13 +498,12 @@ def _passes_language_filter(course: Dict, language: Optional[str], case_sensitiv
     
     if not case_sensitive:
         course_language = course_language.lower()
-        language = language.lower()
     
     return language in course_language
 
 
 def _passes_keyword_filter(course: Dict, keywords: List[str], exclude_keywords: List[str], case_sensitive: bool) -> bool:
-    """Check if course passes keyword filter."""
+    """Check if course passes keyword filter (search terms pre-folded unless case_sensitive)."""
     # Get searchable text
     title = course.get('title', '')
     description = course.get('description', '')
@@ -397,8 +511,6 @@ def _passes_keyword_filter(course: Dict, keywords: List[str], exclude_keywords:
     
     if not case_sensitive:
         searchable_text = searchable_text.lower()
-        keywords = [kw.lower() for kw in keywords]
-        exclude_keywords = [kw.lower() for kw in exclude_keywords]
     
     # Check include keywords
     if keywords:
@@ -427,13 +539,11 @@ def _passes_student_filter(course: Dict, min_students: Optional[int], max_studen
 
 
 def _passes_category_filter(course: Dict, categories: List[str], exclude_categories: List[str], case_sensitive: bool) -> bool:
-    """Check if course passes category filter."""
+    """Check if course passes category filter (search terms pre-folded unless case_sensitive)."""
     course_category = course.get('category', '')
     
     if not case_sensitive:
         course_category = course_category.lower()
-        categories = [cat.lower() for cat in categories]
-        exclude_categories = [cat.lower() for cat in exclude_categories]
     
     # Check include categories
     if categories:
@@ -449,13 +559,11 @@ def _passes_category_filter(course: Dict, categories: List[str], exclude_categor
 
 
 def _passes_instructor_filter(course: Dict, instructors: List[str], exclude_instructors: List[str], case_sensitive: bool) -> bool:
-    """Check if course passes instructor filter."""
+    """Check if course passes instructor filter (search terms pre-folded unless case_sensitive)."""
     course_instructor = course.get('instructor', '')
     
     if not case_sensitive:
         course_instructor = course_instructor.lower()
-        instructors = [inst.lower() for inst in instructors]
-        exclude_instructors = [inst.lower() for inst in exclude_instructors]
     
     # Check include instructors
     if instructors:
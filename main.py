@@ -9,10 +9,11 @@ This is the main entry point that orchestrates the entire application:
 - Handles exceptions and provides user-friendly messages
 """
 
+import atexit
 import logging
+import signal
 import sys
 import tkinter.messagebox as messagebox
-from typing import Optional
 
 # Configure logging
 logging.basicConfig(
@@ -25,6 +26,15 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Bilingual (Arabic/English) message shown when the user skips login
+_LOGIN_REQUIRED_TITLE = "تسجيل الدخول مطلوب"
+_LOGIN_REQUIRED_MSG = (
+    "يجب عليك تسجيل الدخول أولاً لاستخدام الأداة.\n"
+    "You must login first to use this application.\n\n"
+    "يرجى إدخال بريدك الإلكتروني وكلمة المرور المربوطة بحساب يودمي الخاص بك.\n"
+    "Please enter your Udemy email and password to continue."
+)
+
 
 class UdemyEnrollerApp:
     """
@@ -38,8 +48,25 @@ class UdemyEnrollerApp:
         self.scheduler = None
         self.main_gui = None
         
+        # Tear down directly on Ctrl+C / termination instead of unwinding
+        # a KeyboardInterrupt through the GUI and scheduler stacks
+        signal.signal(signal.SIGINT, self._on_signal)
+        signal.signal(signal.SIGTERM, self._on_signal)
+        
         logger.info("Initializing Udemy Course Enroller")
     
+    def _on_signal(self, signum, frame):
+        """
+        Handle SIGINT/SIGTERM by cleaning up and exiting immediately.
+        
+        Args:
+            signum: Signal number received
+            frame: Current stack frame (unused)
+        """
+        logger.info(f"Received signal {signum} - shutting down")
+        self._cleanup()
+        sys.exit(0)
+    
     def run(self):
         """Run the main application."""
         try:
@@ -60,9 +87,6 @@ class UdemyEnrollerApp:
             error_msg = f"Critical error in main application: {str(e)}"
             logger.critical(error_msg)
             self._show_error("Critical Error", error_msg)
-        
-        finally:
-            self._cleanup()
     
     def _show_login(self) -> bool:
         """
@@ -89,11 +113,7 @@ class UdemyEnrollerApp:
             else:
                 logger.info("Authentication failed or user cancelled login")
                 # Show message in Arabic that login is required
-                self._show_error("تسجيل الدخول مطلوب", 
-                    "يجب عليك تسجيل الدخول أولاً لاستخدام الأداة.\n"
-                    "You must login first to use this application.\n\n"
-                    "يرجى إدخال بريدك الإلكتروني وكلمة المرور المربوطة بحساب يودمي الخاص بك.\n"
-                    "Please enter your Udemy email and password to continue.")
+                self._show_error(_LOGIN_REQUIRED_TITLE, _LOGIN_REQUIRED_MSG)
                 return False
             
         except ImportError as e:
@@ -119,6 +139,9 @@ class UdemyEnrollerApp:
         self.session = session
         self.user_info = user_info
         
+        # Only register teardown once there is something to tear down
+        atexit.register(self._cleanup)
+        
         user_name = user_info.get('display_name', 'Unknown') if user_info else 'Unknown'
         logger.info(f"Login successful for user: {user_name}")
     
@@ -168,7 +191,11 @@ class UdemyEnrollerApp:
             self._show_error("GUI Error", error_msg)
     
     def _cleanup(self):
-        """Clean up resources before exiting."""
+        """Clean up resources before exiting. Safe to call more than once."""
+        if getattr(self, '_cleaned', False):
+            return
+        self._cleaned = True
+        
         try:
             logger.info("Cleaning up application resources")
             
@@ -308,10 +335,6 @@ def main():
         app = UdemyEnrollerApp()
         app.run()
         
-    except KeyboardInterrupt:
-        logger.info("Application interrupted by user")
-        print("\nApplication interrupted by user")
-    
     except Exception as e:
         logger.critical(f"Unhandled exception in main: {e}")
         print(f"\nCritical error: {e}")
@@ -8,13 +8,21 @@ It includes course fetching, filtering, and enrollment functionality.
 
 import json
 import logging
+import queue
+import re
 import threading
 import tkinter.messagebox as messagebox
-from datetime import datetime
-from typing import Dict, List, Optional
+import webbrowser
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from tkinter import filedialog
+from typing import Dict, List, Optional, Tuple
 
 import customtkinter as ctk
 
+from filters import build_course_columns, filter_course_indices
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -26,31 +34,23 @@ logger = logging.getLogger(__name__)
 ctk.set_appearance_mode("system")  # Follow system theme
 ctk.set_default_color_theme("blue")
 
-# Import new theme configuration
-try:
-    from theme_config import NEW_COLORS, FONTS as NEW_FONTS, apply_education_theme
-    COLORS = NEW_COLORS
-    FONTS = NEW_FONTS
-    # Apply the education theme
-    apply_education_theme()
-except ImportError:
-    # Fallback to original colors if theme_config is not available
-    COLORS = {
-        'primary': "#6D4C7D",
-        'primary_hover': "#5A3F68",
-        'secondary': "#C86B85",
-        'secondary_hover': "#B55A73",
-        'success': "#27AE60",
-        'success_hover': "#229954",
-        'warning': "#F39C12",
-        'error': "#E74C3C",
-        'surface': "#FFFFFF",
-        'surface_variant': "#F8F9FA",
-        'surface_container': "#F1F3F4",
-        'outline': "#E1E4E8",
-        'on_surface': "#2C3E50",
-        'on_surface_variant': "#6C757D"
-    }
+# Original colors, replaced by the education theme in _load_theme() if available
+COLORS = {
+    'primary': "#6D4C7D",
+    'primary_hover': "#5A3F68",
+    'secondary': "#C86B85",
+    'secondary_hover': "#B55A73",
+    'success': "#27AE60",
+    'success_hover': "#229954",
+    'warning': "#F39C12",
+    'error': "#E74C3C",
+    'surface': "#FFFFFF",
+    'surface_variant': "#F8F9FA",
+    'surface_container': "#F1F3F4",
+    'outline': "#E1E4E8",
+    'on_surface': "#2C3E50",
+    'on_surface_variant': "#6C757D"
+}
 
 FONTS = {
     'display': ("Segoe UI", 32, "bold"),
@@ -59,9 +59,19 @@ FONTS = {
     'body_large': ("Segoe UI", 14),
     'body': ("Segoe UI", 12),
     'label': ("Segoe UI", 11),
-    'button': ("Segoe UI", 12, "bold")
+    'button': ("Segoe UI", 12, "bold"),
+    # Emoji icon glyphs, sized per placement
+    'icon_small': ("Segoe UI", 14),
+    'icon': ("Segoe UI", 16),
+    'icon_medium': ("Segoe UI", 20),
+    'icon_large': ("Segoe UI", 24),
+    'icon_xl': ("Segoe UI", 36),
+    'icon_display': ("Segoe UI", 48)
 }
 
+# Unselected course row background as a (light, dark) pair
+ROW_COLOR = ("gray86", "gray17")
+
 SPACING = {
     'xs': 4,
     'sm': 8,
@@ -71,6 +81,287 @@ SPACING = {
     'xxl': 48
 }
 
+# Number of distinct filter combinations whose results are kept
+FILTER_CACHE_SIZE = 32
+
+# Delay after the last keystroke before filters are re-applied
+FILTER_DEBOUNCE_MS = 180
+
+# Delay before a sort change is applied, so quick successive picks render once
+SORT_DEBOUNCE_MS = 50
+
+# Background workers: one coordinating fetch, one per scrape source and one
+# enrollment run
+BACKGROUND_WORKERS = 4
+
+# Choices for how many courses are enrolled in parallel
+ENROLL_CONCURRENCY_OPTIONS = ["1", "2", "4", "8"]
+
+# How often the UI thread drains callbacks posted by background threads,
+# and the most it runs per tick so a burst can't stall input handling
+UI_POLL_INTERVAL_MS = 16
+UI_QUEUE_BATCH = 50
+
+# Debug console messages are written in batches at most this often, and
+# only the most recent lines are kept
+DEBUG_FLUSH_MS = 100
+DEBUG_MAX_LINES = 500
+
+# Per-course enrollment progress is applied to the UI at most this often
+ENROLL_UPDATE_INTERVAL_MS = 100
+
+# Status bar appearance per status type: (icon, COLORS key for the message)
+STATUS_STYLES = {
+    'info': ("ℹ️", 'on_surface'),
+    'success': ("✅", 'success'),
+    'warning': ("⚠️", 'warning'),
+    'error': ("❌", 'error'),
+    'loading': ("⏳", 'primary')
+}
+
+# Leading number of a scraped duration string, e.g. the 12 in "12 total hours"
+_DURATION_NUMBER = re.compile(r'\d+')
+
+
+def _load_theme():
+    """Load and apply the education theme; called once before the window is built."""
+    global COLORS
+    
+    try:
+        from theme_config import NEW_COLORS, apply_education_theme
+        COLORS = NEW_COLORS
+        # Apply the education theme
+        apply_education_theme()
+    except ImportError:
+        # Keep the original colors if theme_config is not available
+        pass
+
+
+@lru_cache(maxsize=4096)
+def _parse_duration(duration_str) -> float:
+    """Parse duration string to hours for sorting (duration strings repeat heavily)."""
+    if not duration_str:
+        return 0
+    
+    match = _DURATION_NUMBER.search(str(duration_str))
+    return float(match.group()) if match else 0
+
+
+def _course_key(course: Dict):
+    """Identify a course for selection; URLs are unique after scraper de-duplication."""
+    return course.get('url') or id(course)
+
+
+class CourseRow(ctk.CTkFrame):
+    """
+    Pooled course card for the virtualized course list.
+    
+    A fixed number of rows is created and rebound to different courses as
+    the list scrolls, so the row never owns selection state beyond what is
+    on screen.
+    """
+    
+    __slots__ = (
+        'selected', 'course_data', 'course_index', '_color',
+        'checkbox', 'checkbox_var', 'source_badge', 'rating_badge',
+        'title_label', 'duration_label', 'language_label'
+    )
+    
+    def __init__(self, master, fonts, on_select, on_view, on_enroll):
+        """
+        Build the row widgets.
+        
+        Args:
+            master: Parent widget (the list viewport)
+            fonts (dict): Shared CTkFont objects keyed by FONTS name
+            on_select (callable): Called with (row, selected) when the checkbox changes
+            on_view (callable): Called with the bound course dict
+            on_enroll (callable): Called with the bound course index
+        """
+        super().__init__(master, corner_radius=12, fg_color=ROW_COLOR)
+        colors = COLORS
+        spacing = SPACING
+        
+        # Add selection state
+        self._color = ROW_COLOR
+        self.selected = False
+        self.course_data = None
+        self.course_index = -1
+        
+        # Main content frame
+        content_frame = ctk.CTkFrame(self, fg_color="transparent")
+        content_frame.pack(fill="both", expand=True, padx=spacing['md'], pady=spacing['md'])
+        
+        # Header row
+        header_row = ctk.CTkFrame(content_frame, fg_color="transparent")
+        header_row.pack(fill="x", pady=(0, spacing['sm']))
+        
+        # Selection checkbox
+        self.checkbox_var = ctk.BooleanVar()
+        self.checkbox = ctk.CTkCheckBox(
+            header_row,
+            text="",
+            variable=self.checkbox_var,
+            command=lambda: on_select(self, self.checkbox_var.get()),
+            width=20,
+            height=20
+        )
+        self.checkbox.pack(side="left", padx=(0, spacing['sm']))
+        
+        # Source badge
+        self.source_badge = ctk.CTkLabel(
+            header_row,
+            text="",
+            font=fonts['label'],
+            text_color=colors['primary'],
+            fg_color=colors['surface_variant'],
+            corner_radius=12,
+            width=80,
+            height=24
+        )
+        self.source_badge.pack(side="left", padx=(0, spacing['sm']))
+        
+        # Rating badge (packed only for courses that have a rating)
+        self.rating_badge = ctk.CTkLabel(
+            header_row,
+            text="",
+            font=fonts['label'],
+            text_color=colors['success'],
+            fg_color=colors['surface_variant'],
+            corner_radius=12,
+            width=60,
+            height=24
+        )
+        
+        # Course title (single line so every row has the same height)
+        self.title_label = ctk.CTkLabel(
+            content_frame,
+            text="",
+            font=fonts['body_large'],
+            text_color=colors['on_surface'],
+            anchor="w"
+        )
+        self.title_label.pack(fill="x", pady=(0, spacing['xs']))
+        
+        # Course details (left blank when not available)
+        details_frame = ctk.CTkFrame(content_frame, fg_color="transparent")
+        details_frame.pack(fill="x", pady=(0, spacing['sm']))
+        
+        self.duration_label = ctk.CTkLabel(
+            details_frame,
+            text="",
+            font=fonts['label'],
+            text_color=colors['on_surface_variant']
+        )
+        self.duration_label.pack(side="left", padx=(0, spacing['md']))
+        
+        self.language_label = ctk.CTkLabel(
+            details_frame,
+            text="",
+            font=fonts['label'],
+            text_color=colors['on_surface_variant']
+        )
+        self.language_label.pack(side="left", padx=(0, spacing['md']))
+        
+        # Action buttons
+        action_frame = ctk.CTkFrame(content_frame, fg_color="transparent")
+        action_frame.pack(fill="x", pady=(spacing['sm'], 0))
+        
+        # View course button
+        view_btn = ctk.CTkButton(
+            action_frame,
+            text="👁️ View",
+            command=lambda: on_view(self.course_data),
+            width=80,
+            height=32,
+            font=fonts['label'],
+            fg_color="transparent",
+            hover_color=colors['surface_variant'],
+            text_color=colors['on_surface_variant'],
+            border_width=1,
+            border_color=colors['outline']
+        )
+        view_btn.pack(side="left", padx=(0, spacing['sm']))
+        
+        # Enroll button
+        enroll_btn = ctk.CTkButton(
+            action_frame,
+            text="⚡ Enroll",
+            command=lambda: on_enroll(self.course_index),
+            width=100,
+            height=32,
+            font=fonts['button'],
+            fg_color=colors['success'],
+            hover_color=colors['success_hover'],
+            corner_radius=16
+        )
+        enroll_btn.pack(side="right")
+        
+        # Hover effects
+        self.bind("<Enter>", self._on_enter)
+        self.bind("<Leave>", self._on_leave)
+    
+    def show_course(self, course: Dict, index: int, selected: bool):
+        """
+        Show the given course in this row.
+        
+        CTk widgets redraw synchronously on every configure(), so only the
+        parts that actually changed are reconfigured.
+        """
+        if selected != self.selected:
+            self.checkbox_var.set(selected)
+            self.set_selected(selected)
+        
+        # Compare by value so a re-fetched but identical course keeps its row
+        if index == self.course_index and course == self.course_data:
+            self.course_data = course
+            return
+        
+        self.course_data = course
+        self.course_index = index
+        
+        self.source_badge.configure(text=f"📋 {course.get('source', 'Unknown')}")
+        
+        if course.get('rating'):
+            self.rating_badge.configure(text=f"⭐ {course['rating']}")
+            if not self.rating_badge.winfo_manager():
+                self.rating_badge.pack(side="left", padx=(0, SPACING['sm']))
+        elif self.rating_badge.winfo_manager():
+            self.rating_badge.pack_forget()
+        
+        self.title_label.configure(text=course.get('title', 'Unknown Title'))
+        
+        duration = course.get('duration')
+        self.duration_label.configure(text=f"⏱️ {duration}" if duration else "")
+        
+        language = course.get('language')
+        self.language_label.configure(text=f"🌍 {language}" if language else "")
+    
+    def set_selected(self, selected: bool):
+        """Update the selection highlight."""
+        self.selected = selected
+        self._set_color(COLORS['primary'] if selected else ROW_COLOR)
+    
+    def _set_color(self, color):
+        """
+        Set the row background, skipping the redraw if it is unchanged.
+        
+        Enter/Leave also fire when the pointer crosses the row's child
+        widgets, so hover would otherwise redraw the card repeatedly.
+        """
+        if color != self._color:
+            self._color = color
+            self.configure(fg_color=color)
+    
+    def _on_enter(self, event):
+        """Highlight the row on hover."""
+        self._set_color(COLORS['surface_variant'])
+    
+    def _on_leave(self, event):
+        """Restore the row color unless it is selected."""
+        if not self.selected:
+            self._set_color(ROW_COLOR)
+
 
 class MainGUI:
     """
@@ -94,11 +385,13 @@ class MainGUI:
         self.session = session
         self.user_info = user_info
         self.window = None
+        self.fonts = None
         
         # Course data
         self.all_courses = []
         self.filtered_courses = []
-        self.selected_courses = []
+        # Selected courses keyed by _course_key(), in selection order
+        self.selected_courses = {}
         
         # GUI components
         self.courses_listbox = None
@@ -120,8 +413,18 @@ class MainGUI:
         self.enroll_button = None
         self.enroll_selected_btn = None
         self.select_all_btn = None
+        self.concurrency_var = None
         self.sort_var = None
         self.sort_dropdown = None
+        self._selection_info = None
+        
+        # Virtualized course list (pooled rows rebound on scroll)
+        self.courses_viewport = None
+        self.courses_scrollbar = None
+        self._row_pool = []
+        self._row_height = 0
+        self._first_row = 0
+        self._list_message = None
         
         # Filter controls
         self.rating_var = None
@@ -129,26 +432,75 @@ class MainGUI:
         self.language_var = None
         self.keyword_var = None
         
+        # Filter results keyed by filter values, cleared when courses change
+        self._filter_cache = OrderedDict()
+        self._filter_after_id = None
+        self._sort_after_id = None
+        
+        # Pre-parsed filter columns for all_courses (see filters.build_course_columns)
+        self._course_columns = None
+        
+        # Indices of all_courses passing the current filters (None = all), and
+        # per sort option permutations of all_courses computed on first use
+        self._filter_mask = None
+        self._sort_orders = {}
+        
+        # (min_rating, max_duration, language, keywords) of the last applied
+        # filter, re-applied to courses arriving later (None = no filter)
+        self._filter_criteria = None
+        
         # Status tracking
         self.is_fetching = False
         self.is_enrolling = False
         self.enrollment_results = {}
         
+        # Background fetching and enrollment; the scraper (and its HTTP
+        # connection pool) is kept across fetches
+        self._executor = ThreadPoolExecutor(max_workers=BACKGROUND_WORKERS, thread_name_prefix="worker")
+        self._scraper = None
+        
+        # Enroller of the running enrollment, so closing the window can stop it
+        self._enroller = None
+        
+        # Callbacks posted from background threads, run on the UI thread
+        self._ui_queue = queue.Queue()
+        self._ui_poll_id = None
+        
+        # Per-course enrollment results waiting for the next UI tick
+        self._pending_enroll_updates = []
+        self._enroll_updates_lock = threading.Lock()
+        self._enroll_tick_scheduled = False
+        self._enroll_total = 0
+        
+        # Last (icon, color key) applied to the status bar
+        self._status_style = None
+        
         # Debug panel (can be toggled)
         self.debug_mode = False
         self.debug_panel = None
         self.debug_text = None
+        self._debug_buffer = deque(maxlen=DEBUG_MAX_LINES)
+        self._debug_flush_id = None
         
         self._setup_window()
     
     def _setup_window(self):
         """Setup the main window with modern layout."""
+        _load_theme()
+        
         # Create main window
         self.window = ctk.CTk()
         self.window.title("Udemy Course Enroller")
         self.window.geometry("1400x900")
         self.window.minsize(1200, 700)
         
+        # One shared CTkFont per text style rather than a font per widget
+        # (CTkFont needs a Tk root, so these can't be built at import time)
+        self.fonts = {
+            name: ctk.CTkFont(family=spec[0], size=spec[1], weight=spec[2] if len(spec) > 2 else "normal")
+            for name, spec in FONTS.items()
+        }
+        
         # Center the window
         self.window.update_idletasks()
         x = (self.window.winfo_screenwidth() // 2) - (1400 // 2)
@@ -166,9 +518,33 @@ class MainGUI:
         
         # Handle window close
         self.window.protocol("WM_DELETE_WINDOW", self._on_window_close)
+        
+        self._ui_poll_id = self.window.after(UI_POLL_INTERVAL_MS, self._drain_ui_queue)
+    
+    def _post_to_ui(self, callback, *args):
+        """Run callback(*args) on the UI thread; safe to call from any thread."""
+        self._ui_queue.put((callback, args))
+    
+    def _drain_ui_queue(self):
+        """Run callbacks posted by background threads, then poll again."""
+        for _ in range(UI_QUEUE_BATCH):
+            try:
+                callback, args = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            
+            try:
+                callback(*args)
+            except Exception as e:
+                logger.error(f"Error in UI callback {callback.__name__}: {e}")
+        
+        self._ui_poll_id = self.window.after(UI_POLL_INTERVAL_MS, self._drain_ui_queue)
     
     def _create_header(self):
         """Create modern header with branding and main actions."""
+        colors = COLORS
+        spacing = SPACING
+        
         # Header frame
         header_frame = ctk.CTkFrame(self.window, height=80, corner_radius=0)
         header_frame.grid(row=0, column=0, sticky="ew", padx=0, pady=0)
@@ -177,14 +553,14 @@ class MainGUI:
         
         # Left section - Logo and title
         left_section = ctk.CTkFrame(header_frame, fg_color="transparent")
-        left_section.grid(row=0, column=0, sticky="w", padx=SPACING['lg'], pady=SPACING['md'])
+        left_section.grid(row=0, column=0, sticky="w", padx=spacing['lg'], pady=spacing['md'])
         
         # App icon
-        icon_frame = ctk.CTkFrame(left_section, width=50, height=50, corner_radius=25, fg_color=COLORS['primary'])
-        icon_frame.grid(row=0, column=0, padx=(0, SPACING['md']))
+        icon_frame = ctk.CTkFrame(left_section, width=50, height=50, corner_radius=25, fg_color=colors['primary'])
+        icon_frame.grid(row=0, column=0, padx=(0, spacing['md']))
         icon_frame.grid_propagate(False)
         
-        icon_label = ctk.CTkLabel(icon_frame, text="🎓", font=("Segoe UI", 24))
+        icon_label = ctk.CTkLabel(icon_frame, text="🎓", font=self.fonts['icon_large'])
         icon_label.place(relx=0.5, rely=0.5, anchor="center")
         
         # Title and user info
@@ -194,8 +570,8 @@ class MainGUI:
         app_title = ctk.CTkLabel(
             title_section,
             text="Udemy Course Enroller",
-            font=FONTS['title'],
-            text_color=COLORS['primary']
+            font=self.fonts['title'],
+            text_color=colors['primary']
         )
         app_title.pack(anchor="w")
         
@@ -203,14 +579,14 @@ class MainGUI:
         user_label = ctk.CTkLabel(
             title_section,
             text=f"Welcome back, {user_name}",
-            font=FONTS['label'],
-            text_color=COLORS['on_surface_variant']
+            font=self.fonts['label'],
+            text_color=colors['on_surface_variant']
         )
         user_label.pack(anchor="w")
         
         # Right section - Main actions
         right_section = ctk.CTkFrame(header_frame, fg_color="transparent")
-        right_section.grid(row=0, column=2, sticky="e", padx=SPACING['lg'], pady=SPACING['md'])
+        right_section.grid(row=0, column=2, sticky="e", padx=spacing['lg'], pady=spacing['md'])
         
         # Debug toggle (hidden by default)
         self.debug_button = ctk.CTkButton(
@@ -219,12 +595,12 @@ class MainGUI:
             command=self._toggle_debug,
             width=40,
             height=40,
-            font=("Segoe UI", 16),
+            font=self.fonts['icon'],
             fg_color="transparent",
-            hover_color=COLORS['surface_variant'],
+            hover_color=colors['surface_variant'],
             corner_radius=20
         )
-        self.debug_button.pack(side="right", padx=(SPACING['sm'], 0))
+        self.debug_button.pack(side="right", padx=(spacing['sm'], 0))
         
         # Theme toggle
         self.theme_button = ctk.CTkButton(
@@ -233,12 +609,12 @@ class MainGUI:
             command=self._toggle_theme,
             width=40,
             height=40,
-            font=("Segoe UI", 16),
+            font=self.fonts['icon'],
             fg_color="transparent",
-            hover_color=COLORS['surface_variant'],
+            hover_color=colors['surface_variant'],
             corner_radius=20
         )
-        self.theme_button.pack(side="right", padx=(SPACING['sm'], 0))
+        self.theme_button.pack(side="right", padx=(spacing['sm'], 0))
         
         # Fetch button
         self.fetch_button = ctk.CTkButton(
@@ -247,12 +623,12 @@ class MainGUI:
             command=self._on_fetch_courses,
             width=160,
             height=40,
-            font=FONTS['button'],
-            fg_color=COLORS['primary'],
-            hover_color=COLORS['primary_hover'],
+            font=self.fonts['button'],
+            fg_color=colors['primary'],
+            hover_color=colors['primary_hover'],
             corner_radius=8
         )
-        self.fetch_button.pack(side="right", padx=(0, SPACING['sm']))
+        self.fetch_button.pack(side="right", padx=(0, spacing['sm']))
         
         # Enroll button
         self.enroll_button = ctk.CTkButton(
@@ -261,13 +637,13 @@ class MainGUI:
             command=self._on_enroll_all,
             width=140,
             height=40,
-            font=FONTS['button'],
-            fg_color=COLORS['success'],
-            hover_color=COLORS['success_hover'],
+            font=self.fonts['button'],
+            fg_color=colors['success'],
+            hover_color=colors['success_hover'],
             corner_radius=8,
             state="disabled"
         )
-        self.enroll_button.pack(side="right", padx=(0, SPACING['sm']))
+        self.enroll_button.pack(side="right", padx=(0, spacing['sm']))
     
     def _create_main_content(self):
         """Create the main content area with modern, responsive layout."""
@@ -287,25 +663,28 @@ class MainGUI:
     
     def _create_sidebar(self, parent):
         """Create the left sidebar with filters and statistics."""
+        colors = COLORS
+        spacing = SPACING
+        
         sidebar = ctk.CTkFrame(parent, width=300, corner_radius=12)
-        sidebar.grid(row=0, column=0, sticky="nsew", padx=(0, SPACING['md']))
+        sidebar.grid(row=0, column=0, sticky="nsew", padx=(0, spacing['md']))
         sidebar.grid_propagate(False)
         
         # Sidebar header
         sidebar_header = ctk.CTkFrame(sidebar, fg_color="transparent", height=60)
-        sidebar_header.pack(fill="x", padx=SPACING['md'], pady=(SPACING['md'], 0))
+        sidebar_header.pack(fill="x", padx=spacing['md'], pady=(spacing['md'], 0))
         sidebar_header.pack_propagate(False)
         
-        filter_icon = ctk.CTkLabel(sidebar_header, text="🔍", font=("Segoe UI", 20))
-        filter_icon.pack(side="left", pady=SPACING['sm'])
+        filter_icon = ctk.CTkLabel(sidebar_header, text="🔍", font=self.fonts['icon_medium'])
+        filter_icon.pack(side="left", pady=spacing['sm'])
         
         filter_title = ctk.CTkLabel(
             sidebar_header,
             text="Smart Filters",
-            font=FONTS['title'],
-            text_color=COLORS['on_surface']
+            font=self.fonts['title'],
+            text_color=colors['on_surface']
         )
-        filter_title.pack(side="left", padx=(SPACING['sm'], 0), pady=SPACING['sm'])
+        filter_title.pack(side="left", padx=(spacing['sm'], 0), pady=spacing['sm'])
         
         # Filter controls
         self._create_filter_controls(sidebar)
@@ -318,8 +697,11 @@ class MainGUI:
     
     def _create_filter_controls(self, parent):
         """Create modern filter controls."""
+        colors = COLORS
+        spacing = SPACING
+        
         filters_frame = ctk.CTkFrame(parent, fg_color="transparent")
-        filters_frame.pack(fill="x", padx=SPACING['md'], pady=(SPACING['md'], 0))
+        filters_frame.pack(fill="x", padx=spacing['md'], pady=(spacing['md'], 0))
         
         # Rating filter
         self._create_filter_input(
@@ -359,7 +741,7 @@ class MainGUI:
         
         # Filter actions
         filter_actions = ctk.CTkFrame(filters_frame, fg_color="transparent")
-        filter_actions.pack(fill="x", pady=(SPACING['lg'], 0))
+        filter_actions.pack(fill="x", pady=(spacing['lg'], 0))
         
         # Apply filters button
         self.apply_filters_btn = ctk.CTkButton(
@@ -367,12 +749,12 @@ class MainGUI:
             text="Apply Filters",
             command=self._on_apply_filters,
             height=40,
-            font=FONTS['button'],
-            fg_color=COLORS['primary'],
-            hover_color=COLORS['primary_hover'],
+            font=self.fonts['button'],
+            fg_color=colors['primary'],
+            hover_color=colors['primary_hover'],
             corner_radius=8
         )
-        self.apply_filters_btn.pack(fill="x", pady=(0, SPACING['sm']))
+        self.apply_filters_btn.pack(fill="x", pady=(0, spacing['sm']))
         
         # Clear filters button
         self.clear_filters_btn = ctk.CTkButton(
@@ -380,12 +762,12 @@ class MainGUI:
             text="Clear All",
             command=self._on_clear_filters,
             height=36,
-            font=FONTS['label'],
+            font=self.fonts['label'],
             fg_color="transparent",
-            hover_color=COLORS['surface_variant'],
-            text_color=COLORS['on_surface_variant'],
+            hover_color=colors['surface_variant'],
+            text_color=colors['on_surface_variant'],
             border_width=1,
-            border_color=COLORS['outline'],
+            border_color=colors['outline'],
             corner_radius=8
         )
         self.clear_filters_btn.pack(fill="x")
@@ -400,7 +782,7 @@ class MainGUI:
         label = ctk.CTkLabel(
             input_container,
             text=label_text,
-            font=FONTS['label'],
+            font=self.fonts['label'],
             text_color=COLORS['on_surface']
         )
         label.pack(anchor="w", pady=(0, SPACING['xs']))
@@ -414,15 +796,15 @@ class MainGUI:
             textvariable=var,
             placeholder_text=placeholder,
             height=36,
-            font=FONTS['body'],
+            font=self.fonts['body'],
             corner_radius=8,
             border_width=1,
             border_color=COLORS['outline']
         )
         entry.pack(fill="x")
         
-        # Bind Enter key to apply filters
-        entry.bind('<Return>', lambda e: self._on_apply_filters())
+        # Re-apply filters as the user types (Enter included), debounced
+        entry.bind('<KeyRelease>', self._schedule_filter)
     
     def _create_statistics_panel(self, parent):
         """Create statistics panel with modern cards."""
@@ -433,7 +815,7 @@ class MainGUI:
         stats_header = ctk.CTkLabel(
             stats_frame,
             text="📊 Statistics",
-            font=FONTS['body_large'],
+            font=self.fonts['body_large'],
             text_color=COLORS['on_surface']
         )
         stats_header.pack(pady=(SPACING['md'], SPACING['sm']))
@@ -466,13 +848,13 @@ class MainGUI:
         header_frame = ctk.CTkFrame(card_content, fg_color="transparent")
         header_frame.pack(fill="x")
         
-        icon_label = ctk.CTkLabel(header_frame, text=icon, font=("Segoe UI", 14))
+        icon_label = ctk.CTkLabel(header_frame, text=icon, font=self.fonts['icon_small'])
         icon_label.pack(side="left")
         
         label_text = ctk.CTkLabel(
             header_frame,
             text=label,
-            font=FONTS['label'],
+            font=self.fonts['label'],
             text_color=COLORS['on_surface_variant']
         )
         label_text.pack(side="left", padx=(SPACING['xs'], 0))
@@ -481,13 +863,14 @@ class MainGUI:
         value_label = ctk.CTkLabel(
             card_content,
             text=value,
-            font=FONTS['body_large'],
+            font=self.fonts['body_large'],
             text_color=COLORS['on_surface']
         )
         value_label.pack(anchor="w", pady=(SPACING['xs'], 0))
         
-        # Store value label for updates
+        # Store value label (and its current text) for updates
         card.value_label = value_label
+        card.value_text = value
         
         return card
     
@@ -502,7 +885,7 @@ class MainGUI:
             text="🔄 Refresh",
             command=self._on_refresh,
             height=40,
-            font=FONTS['button'],
+            font=self.fonts['button'],
             fg_color=COLORS['secondary'],
             hover_color=COLORS['primary_hover'],
             corner_radius=8
@@ -514,7 +897,7 @@ class MainGUI:
             text="📤 Export List",
             command=self._on_export_courses,
             height=40,
-            font=FONTS['button'],
+            font=self.fonts['button'],
             fg_color="transparent",
             hover_color=COLORS['surface_variant'],
             text_color=COLORS['on_surface_variant'],
@@ -551,7 +934,7 @@ class MainGUI:
         self.content_title = ctk.CTkLabel(
             title_section,
             text="📚 Available Courses",
-            font=FONTS['title'],
+            font=self.fonts['title'],
             text_color=COLORS['on_surface']
         )
         self.content_title.pack(anchor="w", pady=(SPACING['sm'], 0))
@@ -559,7 +942,7 @@ class MainGUI:
         self.course_count_label = ctk.CTkLabel(
             title_section,
             text="Ready to discover amazing courses",
-            font=FONTS['label'],
+            font=self.fonts['label'],
             text_color=COLORS['on_surface_variant']
         )
         self.course_count_label.pack(anchor="w")
@@ -577,27 +960,35 @@ class MainGUI:
             command=self._on_sort_changed,
             width=120,
             height=32,
-            font=FONTS['body']
+            font=self.fonts['body']
         )
         self.sort_dropdown.pack(side="right", padx=(SPACING['sm'], 0))
         
         sort_label = ctk.CTkLabel(
             view_options,
             text="Sort by:",
-            font=FONTS['label'],
+            font=self.fonts['label'],
             text_color=COLORS['on_surface_variant']
         )
         sort_label.pack(side="right", pady=SPACING['sm'])
     
     def _create_course_list(self, parent):
-        """Create the scrollable course list."""
-        # Create scrollable frame
-        self.courses_scrollable = ctk.CTkScrollableFrame(
-            parent,
-            corner_radius=0,
-            fg_color="transparent"
-        )
-        self.courses_scrollable.pack(fill="both", expand=True, padx=SPACING['md'], pady=(SPACING['md'], 0))
+        """Create the virtualized course list."""
+        list_frame = ctk.CTkFrame(parent, fg_color="transparent")
+        list_frame.pack(fill="both", expand=True, padx=SPACING['md'], pady=(SPACING['md'], 0))
+        
+        # Only enough rows to fill the viewport are ever created; scrolling
+        # rebinds them to other courses instead of building a card per course
+        self.courses_scrollbar = ctk.CTkScrollbar(list_frame, command=self._on_list_scroll)
+        self.courses_scrollbar.pack(side="right", fill="y")
+        
+        self.courses_viewport = ctk.CTkFrame(list_frame, fg_color="transparent")
+        self.courses_viewport.pack(side="left", fill="both", expand=True)
+        self.courses_viewport.pack_propagate(False)
+        self.courses_viewport.bind("<Configure>", self._on_list_resize)
+        
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.window.bind_all(sequence, self._on_list_mousewheel, add="+")
         
         # Initially show empty state
         self._show_empty_state()
@@ -615,7 +1006,7 @@ class MainGUI:
         self.selection_label = ctk.CTkLabel(
             selection_frame,
             text="No courses selected",
-            font=FONTS['body'],
+            font=self.fonts['body'],
             text_color=COLORS['on_surface_variant']
         )
         self.selection_label.pack(anchor="w", pady=(SPACING['md'], 0))
@@ -631,7 +1022,7 @@ class MainGUI:
             command=self._on_select_all,
             width=100,
             height=36,
-            font=FONTS['label'],
+            font=self.fonts['label'],
             fg_color="transparent",
             hover_color=COLORS['surface_variant'],
             text_color=COLORS['on_surface_variant'],
@@ -647,12 +1038,32 @@ class MainGUI:
             command=self._on_enroll_selected,
             width=140,
             height=36,
-            font=FONTS['button'],
+            font=self.fonts['button'],
             fg_color=COLORS['success'],
             hover_color=COLORS['success_hover'],
             state="disabled"
         )
         self.enroll_selected_btn.pack(side="right", padx=(0, SPACING['sm']), pady=SPACING['md'])
+        
+        # Parallel enrollment selector
+        self.concurrency_var = ctk.StringVar(value=ENROLL_CONCURRENCY_OPTIONS[0])
+        concurrency_menu = ctk.CTkOptionMenu(
+            bulk_actions,
+            variable=self.concurrency_var,
+            values=ENROLL_CONCURRENCY_OPTIONS,
+            width=60,
+            height=36,
+            font=self.fonts['label']
+        )
+        concurrency_menu.pack(side="right", padx=(0, SPACING['sm']), pady=SPACING['md'])
+        
+        concurrency_label = ctk.CTkLabel(
+            bulk_actions,
+            text="Parallel:",
+            font=self.fonts['label'],
+            text_color=COLORS['on_surface_variant']
+        )
+        concurrency_label.pack(side="right", padx=(0, SPACING['xs']), pady=SPACING['md'])
     
     def _create_status_bar(self):
         """Create the modern status bar at the bottom."""
@@ -668,14 +1079,14 @@ class MainGUI:
         self.status_icon = ctk.CTkLabel(
             status_content,
             text="✅",
-            font=("Segoe UI", 16)
+            font=self.fonts['icon']
         )
         self.status_icon.pack(side="left", padx=(0, SPACING['xs']))
         
         self.status_label = ctk.CTkLabel(
             status_content,
             text="Ready to discover amazing courses",
-            font=FONTS['body'],
+            font=self.fonts['body'],
             text_color=COLORS['on_surface']
         )
         self.status_label.pack(side="left")
@@ -697,26 +1108,25 @@ class MainGUI:
         version_label = ctk.CTkLabel(
             status_frame,
             text="v1.0.0",
-            font=FONTS['label'],
+            font=self.fonts['label'],
             text_color=COLORS['on_surface_variant']
         )
         version_label.grid(row=0, column=2, sticky="e", padx=SPACING['md'], pady=SPACING['sm'])
     
     def _show_empty_state(self):
         """Show modern empty state when no courses are loaded."""
-        # Clear existing widgets
-        for widget in self.courses_scrollable.winfo_children():
-            widget.destroy()
+        self._clear_course_list()
         
         # Empty state container
-        empty_container = ctk.CTkFrame(self.courses_scrollable, fg_color="transparent")
+        empty_container = ctk.CTkFrame(self.courses_viewport, fg_color="transparent")
         empty_container.pack(expand=True, fill="both", pady=100)
+        self._list_message = empty_container
         
         # Empty state icon
         empty_icon = ctk.CTkLabel(
             empty_container,
             text="🎯",
-            font=("Segoe UI", 48)
+            font=self.fonts['icon_display']
         )
         empty_icon.pack(pady=(0, SPACING['md']))
         
@@ -724,7 +1134,7 @@ class MainGUI:
         empty_title = ctk.CTkLabel(
             empty_container,
             text="Ready to Discover Courses",
-            font=FONTS['headline'],
+            font=self.fonts['headline'],
             text_color=COLORS['on_surface']
         )
         empty_title.pack(pady=(0, SPACING['sm']))
@@ -733,7 +1143,7 @@ class MainGUI:
         empty_desc = ctk.CTkLabel(
             empty_container,
             text="Click 'Discover Courses' to find amazing free courses\nfrom multiple sources with available coupons",
-            font=FONTS['body'],
+            font=self.fonts['body'],
             text_color=COLORS['on_surface_variant'],
             justify="center"
         )
@@ -746,7 +1156,7 @@ class MainGUI:
             command=self._on_fetch_courses,
             height=48,
             width=200,
-            font=FONTS['button'],
+            font=self.fonts['button'],
             fg_color=COLORS['primary'],
             hover_color=COLORS['primary_hover'],
             corner_radius=24
@@ -762,10 +1172,8 @@ class MainGUI:
         self.fetch_button.configure(text="⏳ Discovering...", state="disabled")
         self._show_status("Discovering courses from multiple sources...", show_progress=True, status_type="loading")
         
-        # Start fetching in separate thread
-        thread = threading.Thread(target=self._fetch_courses_thread)
-        thread.daemon = True
-        thread.start()
+        # Start fetching in the background
+        self._executor.submit(self._fetch_courses_thread)
     
     def _fetch_courses_thread(self):
         """Fetch courses in background thread."""
@@ -775,38 +1183,81 @@ class MainGUI:
             
             logger.info("Starting course fetching")
             
-            # Create scraper and fetch courses
-            scraper = UdemyCouponScraper()
-            courses = scraper.get_all_courses()
+            if self._scraper is None:
+                self._scraper = UdemyCouponScraper()
+            
+            # Scrape all sources concurrently and show each source's courses
+            # as soon as it finishes; the first batch replaces the old list
+            batches = 0
+            for batch in self._scraper.iter_courses(self._executor):
+                self._post_to_ui(self._append_courses, batch, batches == 0)
+                batches += 1
+            
+            # Every source failed or timed out; don't report the old list
+            if not batches:
+                self._post_to_ui(self._on_fetch_error, "No course source could be reached")
+                return
             
             # Update UI in main thread
-            self.window.after(0, lambda: self._on_courses_fetched(courses))
+            self._post_to_ui(self._on_courses_fetched)
             
         except Exception as e:
             error_msg = f"Error fetching courses: {str(e)}"
             logger.error(error_msg)
-            self.window.after(0, lambda: self._on_fetch_error(error_msg))
+            self._post_to_ui(self._on_fetch_error, error_msg)
     
-    def _on_courses_fetched(self, courses: List[Dict]):
-        """Handle successful course fetching with improved UX."""
-        self.all_courses = courses
-        self.filtered_courses = courses.copy()
+    def _append_courses(self, courses: List[Dict], replace: bool = False):
+        """
+        Add a batch of fetched courses to the list while fetching continues.
         
-        # Clear selection since courses changed
-        self.selected_courses.clear()
+        Args:
+            courses: Newly fetched courses (already de-duplicated)
+            replace: Drop the previously shown courses first
+        """
+        # Parse filterable fields and lowercase search text once per course
+        columns = build_course_columns(courses)
         
-        self._update_course_display()
-        self._update_stats()
-        self._update_selection_info()
+        if replace:
+            self.all_courses = list(courses)
+            self._course_columns = columns
+            
+            # Clear selection since courses changed
+            self.selected_courses.clear()
+            self._update_selection_info()
+        elif courses:
+            self.all_courses.extend(courses)
+            for name, values in columns.items():
+                self._course_columns[name].extend(values)
+        else:
+            return
+        
+        self._filter_cache.clear()
+        self._sort_orders.clear()
         
+        # Keep the user's filter applied to the grown list
+        self._filter_mask = self._match_filter_criteria(self._filter_criteria)
+        self._refresh_filtered_courses()
+        
+        # Keep the scroll position when later batches arrive
+        if replace or self._list_message is not None:
+            self._update_course_display()
+        else:
+            self._ensure_row_pool()
+            self._render_window(self._first_row)
+        
+        self._update_stats()
+    
+    def _on_courses_fetched(self):
+        """Handle successful course fetching with improved UX."""
         self.is_fetching = False
         self.fetch_button.configure(text="🔍 Discover Courses", state="normal")
         self.enroll_button.configure(state="normal")
         
         # Show success status
-        self._show_status(f"Successfully discovered {len(courses)} courses!", status_type="success")
+        total = len(self.all_courses)
+        self._show_status(f"Successfully discovered {total} courses!", status_type="success")
         
-        logger.info(f"Successfully fetched {len(courses)} courses")
+        logger.info(f"Successfully fetched {total} courses")
     
     def _on_fetch_error(self, error_msg: str):
         """Handle course fetching error with improved UX."""
@@ -816,101 +1267,108 @@ class MainGUI:
         
         messagebox.showerror("Discovery Error", f"Failed to discover courses:\n\n{error_msg}")
     
-    def _on_enrollment_complete(self, results: Dict):
-        """Handle successful completion of enrollment with improved UX."""
-        self.enrollment_results = results
-        
-        # Count successful enrollments
-        successful = sum(1 for r in results.values() if r.get('success', False))
-        total = len(results)
-        
-        self.is_enrolling = False
-        self.enroll_button.configure(text="⚡ Enroll All", state="normal")
-        
-        # Show success status
-        if successful == total:
-            status_msg = f"Perfect! All {total} courses enrolled successfully!"
-            status_type = "success"
-        elif successful > 0:
-            status_msg = f"Partially complete: {successful}/{total} courses enrolled"
-            status_type = "warning"
-        else:
-            status_msg = f"No courses enrolled successfully"
-            status_type = "error"
-        
-        self._show_status(status_msg, status_type=status_type)
-        
-        # Update statistics
-        self._update_stats()
+    def _schedule_filter(self, event=None):
+        """Coalesce a burst of filter keystrokes into a single filter pass."""
+        if self._filter_after_id is not None:
+            self.window.after_cancel(self._filter_after_id)
         
-        # Show detailed results
-        self._show_enrollment_results(results)
-        
-        logger.info(f"Enrollment complete: {successful}/{total} successful")
+        self._filter_after_id = self.window.after(FILTER_DEBOUNCE_MS, self._on_debounced_filter)
     
-    def _on_enrollment_error(self, error_msg: str):
-        """Handle enrollment error with improved UX."""
-        self.is_enrolling = False
-        self.enroll_button.configure(text="⚡ Enroll All", state="normal")
-        self._show_status(f"Enrollment failed: {error_msg}", status_type="error")
+    def _on_debounced_filter(self):
+        """Apply filters once typing has paused."""
+        self._filter_after_id = None
         
-        messagebox.showerror("Enrollment Error", f"Enrollment process failed:\n\n{error_msg}")
+        # Nothing to filter yet; don't nag while the user is typing
+        if self.all_courses:
+            self._on_apply_filters(interactive=False)
     
-    def _enroll_in_courses(self, courses: List[Dict]):
-        """Enroll in multiple courses with improved UX."""
-        if self.is_enrolling:
-            return
-        
-        self.is_enrolling = True
-        self.enroll_button.configure(text="⚡ Enrolling...", state="disabled")
-        self._show_status(f"Starting enrollment in {len(courses)} courses...", show_progress=True, status_type="loading")
+    def _on_apply_filters(self, interactive: bool = True):
+        """
+        Apply filters to the course list.
         
-        # Start enrollment in separate thread
-        thread = threading.Thread(target=self._enroll_courses_thread, args=(courses,))
-        thread.daemon = True
-        thread.start()
-    
-    def _on_apply_filters(self):
-        """Apply filters to the course list."""
+        Args:
+            interactive: Report invalid filter values in a dialog rather
+                than in the status bar (used for explicit applies)
+        """
         if not self.all_courses:
             messagebox.showwarning("No Courses", "Please fetch courses first")
             return
         
+        # An explicit apply supersedes any pending debounced one
+        if self._filter_after_id is not None:
+            self.window.after_cancel(self._filter_after_id)
+            self._filter_after_id = None
+        
         try:
-            # Import filter function
-            from filters import filter_courses
-            
             # Get filter values
             min_rating = float(self.rating_var.get()) if self.rating_var.get() else 0.0
             max_duration = float(self.duration_var.get()) if self.duration_var.get() else None
-            language = self.language_var.get().strip() if self.language_var.get() else None
-            keywords = self.keyword_var.get().strip() if self.keyword_var.get() else None
+            language = self.language_var.get().strip().lower() or None
             
-            # Split keywords by comma
-            if keywords:
-                keywords = [kw.strip() for kw in keywords.split(',') if kw.strip()]
+            # Split keywords by comma; order and repeats don't change the result
+            keywords = tuple(sorted({
+                kw.strip().lower() for kw in self.keyword_var.get().split(',') if kw.strip()
+            }))
             
-            # Apply filters
-            self.filtered_courses = filter_courses(
-                self.all_courses,
-                min_rating=min_rating,
-                max_duration=max_duration,
-                language=language,
-                keywords=keywords
-            )
+            # Key on the parsed values so equivalent inputs ("4.5" and "4.50",
+            # "Python, Web" and "web,python") share a cache entry
+            cache_key = (min_rating, max_duration, language, keywords)
             
-            self._update_course_display()
-            self._update_stats()
+            cached = self._filter_cache.get(cache_key)
+            if cached is not None:
+                self._filter_cache.move_to_end(cache_key)
+            else:
+                cached = self._match_filter_criteria(cache_key)
+                
+                self._filter_cache[cache_key] = cached
+                if len(self._filter_cache) > FILTER_CACHE_SIZE:
+                    self._filter_cache.popitem(last=False)
+            
+            self._filter_criteria = cache_key
+            
+            # Only rebuild the list when the matching set actually changed
+            if cached != self._filter_mask:
+                self._filter_mask = cached
+                self._refresh_filtered_courses()
+                
+                self._update_course_display()
+                self._update_stats()
             
             self._show_status(f"Applied filters - {len(self.filtered_courses)} courses match")
             
         except ValueError as e:
-            messagebox.showerror("Filter Error", f"Invalid filter value: {str(e)}")
+            if interactive:
+                messagebox.showerror("Filter Error", f"Invalid filter value: {str(e)}")
+            else:
+                self._show_status(f"Invalid filter value: {str(e)}", status_type="warning")
         except Exception as e:
             error_msg = f"Error applying filters: {str(e)}"
             logger.error(error_msg)
             messagebox.showerror("Filter Error", error_msg)
     
+    def _match_filter_criteria(self, criteria: Optional[Tuple]) -> Optional[frozenset]:
+        """
+        Find the courses in all_courses matching a set of filter values.
+        
+        Args:
+            criteria: (min_rating, max_duration, language, keywords) as
+                parsed by _on_apply_filters, or None for no filter
+            
+        Returns:
+            Indices of the matching courses, or None when not filtering
+        """
+        if criteria is None:
+            return None
+        
+        min_rating, max_duration, language, keywords = criteria
+        return frozenset(filter_course_indices(
+            self._course_columns,
+            min_rating=min_rating,
+            max_duration=max_duration,
+            language=language,
+            keywords=list(keywords)
+        ))
+    
     def _on_clear_filters(self):
         """Clear all filters."""
         self.rating_var.set("0.0")
@@ -918,7 +1376,9 @@ class MainGUI:
         self.language_var.set("")
         self.keyword_var.set("")
         
-        self.filtered_courses = self.all_courses.copy()
+        self._filter_criteria = None
+        self._filter_mask = None
+        self._refresh_filtered_courses()
         self._update_course_display()
         self._update_stats()
         
@@ -926,20 +1386,19 @@ class MainGUI:
     
     def _update_course_display(self):
         """Update the course list display with modern styling."""
-        # Clear existing widgets
-        for widget in self.courses_scrollable.winfo_children():
-            widget.destroy()
-        
         if not self.filtered_courses:
+            self._clear_course_list()
+            
             # Show "no results" state
-            no_results_container = ctk.CTkFrame(self.courses_scrollable, fg_color="transparent")
+            no_results_container = ctk.CTkFrame(self.courses_viewport, fg_color="transparent")
             no_results_container.pack(expand=True, fill="both", pady=100)
+            self._list_message = no_results_container
             
             # No results icon
             no_results_icon = ctk.CTkLabel(
                 no_results_container,
                 text="🔍",
-                font=("Segoe UI", 36)
+                font=self.fonts['icon_xl']
             )
             no_results_icon.pack(pady=(0, SPACING['md']))
             
@@ -947,7 +1406,7 @@ class MainGUI:
             no_results_title = ctk.CTkLabel(
                 no_results_container,
                 text="No Courses Found",
-                font=FONTS['title'],
+                font=self.fonts['title'],
                 text_color=COLORS['on_surface']
             )
             no_results_title.pack(pady=(0, SPACING['sm']))
@@ -956,175 +1415,129 @@ class MainGUI:
             no_results_desc = ctk.CTkLabel(
                 no_results_container,
                 text="Try adjusting your filters or fetch new courses",
-                font=FONTS['body'],
+                font=self.fonts['body'],
                 text_color=COLORS['on_surface_variant']
             )
             no_results_desc.pack()
             
             return
         
-        # Display courses
-        for i, course in enumerate(self.filtered_courses):
-            self._create_course_widget(course, i)
+        if self._list_message is not None:
+            self._list_message.destroy()
+            self._list_message = None
+        
+        # Display courses from the top of the list
+        self._ensure_row_pool()
+        self._render_window(0)
         
         # Update course count in header
         self._update_course_count()
     
-    def _create_course_widget(self, course: Dict, index: int):
-        """Create a modern widget for displaying a single course."""
-        # Course card
-        course_card = ctk.CTkFrame(self.courses_scrollable, corner_radius=12)
-        course_card.pack(fill="x", pady=SPACING['sm'], padx=SPACING['xs'])
-        
-        # Add selection state
-        course_card.selected = False
-        course_card.course_data = course
-        course_card.course_index = index
-        
-        # Main content frame
-        content_frame = ctk.CTkFrame(course_card, fg_color="transparent")
-        content_frame.pack(fill="both", expand=True, padx=SPACING['md'], pady=SPACING['md'])
-        
-        # Header row
-        header_row = ctk.CTkFrame(content_frame, fg_color="transparent")
-        header_row.pack(fill="x", pady=(0, SPACING['sm']))
+    def _clear_course_list(self):
+        """Hide all course rows and remove any empty/no-results message."""
+        for card in self._row_pool:
+            if card.winfo_manager():
+                card.pack_forget()
         
-        # Selection checkbox
-        checkbox_var = ctk.BooleanVar()
-        checkbox = ctk.CTkCheckBox(
-            header_row,
-            text="",
-            variable=checkbox_var,
-            command=lambda: self._on_course_selection_changed(course_card, checkbox_var.get()),
-            width=20,
-            height=20
-        )
-        checkbox.pack(side="left", padx=(0, SPACING['sm']))
-        course_card.checkbox = checkbox
-        course_card.checkbox_var = checkbox_var
-        
-        # Source badge
-        source = course.get('source', 'Unknown')
-        source_badge = ctk.CTkLabel(
-            header_row,
-            text=f"📋 {source}",
-            font=FONTS['label'],
-            text_color=COLORS['primary'],
-            fg_color=COLORS['surface_variant'],
-            corner_radius=12,
-            width=80,
-            height=24
-        )
-        source_badge.pack(side="left", padx=(0, SPACING['sm']))
-        
-        # Rating badge (if available)
-        if 'rating' in course and course['rating']:
-            rating_badge = ctk.CTkLabel(
-                header_row,
-                text=f"⭐ {course['rating']}",
-                font=FONTS['label'],
-                text_color=COLORS['success'],
-                fg_color=COLORS['surface_variant'],
-                corner_radius=12,
-                width=60,
-                height=24
-            )
-            rating_badge.pack(side="left", padx=(0, SPACING['sm']))
+        if self._list_message is not None:
+            self._list_message.destroy()
+            self._list_message = None
         
-        # Course title
-        title = course.get('title', 'Unknown Title')
-        title_label = ctk.CTkLabel(
-            content_frame,
-            text=title,
-            font=FONTS['body_large'],
-            text_color=COLORS['on_surface'],
-            anchor="w",
-            wraplength=500
-        )
-        title_label.pack(fill="x", pady=(0, SPACING['xs']))
+        self.courses_scrollbar.set(0.0, 1.0)
+    
+    def _ensure_row_pool(self):
+        """Grow the row pool until it can fill the viewport height."""
+        if not self._row_pool:
+            # Measure a prototype row once; every row has the same layout
+            prototype = self._create_course_row()
+            prototype.show_course(self.filtered_courses[0], 0, False)
+            prototype.update_idletasks()
+            scaling = ctk.ScalingTracker.get_widget_scaling(prototype)
+            self._row_height = prototype.winfo_reqheight() + int(2 * SPACING['sm'] * scaling)
+            self._row_pool.append(prototype)
+        
+        # Ceiling division so a partially visible last row is still drawn
+        rows_needed = -(-self.courses_viewport.winfo_height() // self._row_height)
+        while len(self._row_pool) < rows_needed:
+            self._row_pool.append(self._create_course_row())
+    
+    def _render_window(self, first: int):
+        """Bind the pooled rows to the courses starting at index ``first``."""
+        total = len(self.filtered_courses)
+        visible_rows = self._visible_rows()
+        first = max(0, min(first, total - visible_rows))
+        self._first_row = first
+        
+        # Hidden rows are always a tail of the pool, so packing in order
+        # keeps the on-screen order intact
+        for slot, card in enumerate(self._row_pool):
+            index = first + slot
+            if index < total:
+                course = self.filtered_courses[index]
+                card.show_course(course, index, _course_key(course) in self.selected_courses)
+                if not card.winfo_manager():
+                    card.pack(fill="x", pady=SPACING['sm'], padx=SPACING['xs'])
+            elif card.winfo_manager():
+                card.pack_forget()
+        
+        if total:
+            self.courses_scrollbar.set(first / total, min(total, first + visible_rows) / total)
+    
+    def _visible_rows(self) -> int:
+        """Number of rows that fit fully in the viewport (at least one)."""
+        return max(1, self.courses_viewport.winfo_height() // self._row_height)
+    
+    def _on_list_scroll(self, action, value, unit=None):
+        """Translate scrollbar commands into a new first visible row."""
+        if not self._row_pool or self._list_message is not None:
+            return
         
-        # Course details
-        details_frame = ctk.CTkFrame(content_frame, fg_color="transparent")
-        details_frame.pack(fill="x", pady=(0, SPACING['sm']))
-        
-        # Duration (if available)
-        if 'duration' in course and course['duration']:
-            duration_label = ctk.CTkLabel(
-                details_frame,
-                text=f"⏱️ {course['duration']}",
-                font=FONTS['label'],
-                text_color=COLORS['on_surface_variant']
-            )
-            duration_label.pack(side="left", padx=(0, SPACING['md']))
-        
-        # Language (if available)
-        if 'language' in course and course['language']:
-            language_label = ctk.CTkLabel(
-                details_frame,
-                text=f"🌍 {course['language']}",
-                font=FONTS['label'],
-                text_color=COLORS['on_surface_variant']
-            )
-            language_label.pack(side="left", padx=(0, SPACING['md']))
+        if action == "moveto":
+            first = int(float(value) * len(self.filtered_courses))
+        elif unit == "pages":
+            first = self._first_row + int(float(value)) * self._visible_rows()
+        else:
+            first = self._first_row + int(float(value))
         
-        # Action buttons
-        action_frame = ctk.CTkFrame(content_frame, fg_color="transparent")
-        action_frame.pack(fill="x", pady=(SPACING['sm'], 0))
+        self._render_window(first)
+    
+    def _on_list_mousewheel(self, event):
+        """Scroll the course list one row per wheel step."""
+        if not self._row_pool or self._list_message is not None:
+            return
         
-        # View course button
-        view_btn = ctk.CTkButton(
-            action_frame,
-            text="👁️ View",
-            command=lambda: self._on_view_course(course),
-            width=80,
-            height=32,
-            font=FONTS['label'],
-            fg_color="transparent",
-            hover_color=COLORS['surface_variant'],
-            text_color=COLORS['on_surface_variant'],
-            border_width=1,
-            border_color=COLORS['outline']
-        )
-        view_btn.pack(side="left", padx=(0, SPACING['sm']))
+        # Widget path names are hierarchical, so this matches any descendant
+        if not str(event.widget).startswith(str(self.courses_viewport)):
+            return
         
-        # Enroll button
-        enroll_btn = ctk.CTkButton(
-            action_frame,
-            text="⚡ Enroll",
-            command=lambda: self._on_enroll_single(index),
-            width=100,
-            height=32,
-            font=FONTS['button'],
-            fg_color=COLORS['success'],
-            hover_color=COLORS['success_hover'],
-            corner_radius=16
+        step = -1 if (event.num == 4 or event.delta > 0) else 1
+        self._render_window(self._first_row + step)
+    
+    def _on_list_resize(self, event):
+        """Grow the row pool and re-render when the viewport is resized."""
+        if self._row_pool and self._list_message is None and self.filtered_courses:
+            self._ensure_row_pool()
+            self._render_window(self._first_row)
+    
+    def _create_course_row(self):
+        """Create an unbound course row for the row pool."""
+        return CourseRow(
+            self.courses_viewport,
+            self.fonts,
+            on_select=self._on_course_selection_changed,
+            on_view=self._on_view_course,
+            on_enroll=self._on_enroll_single
         )
-        enroll_btn.pack(side="right")
-        
-        # Hover effects
-        def on_enter(event):
-            course_card.configure(fg_color=COLORS['surface_variant'])
-        
-        def on_leave(event):
-            if not course_card.selected:
-                course_card.configure(fg_color=["gray86", "gray17"])
-        
-        course_card.bind("<Enter>", on_enter)
-        course_card.bind("<Leave>", on_leave)
-        
-        return course_card
     
     def _on_course_selection_changed(self, course_card, selected):
         """Handle course selection change."""
-        course_card.selected = selected
+        course_card.set_selected(selected)
         
+        course = course_card.course_data
         if selected:
-            course_card.configure(fg_color=COLORS['primary'])
-            self.selected_courses.append(course_card.course_data)
+            self.selected_courses[_course_key(course)] = course
         else:
-            course_card.configure(fg_color=["gray86", "gray17"])
-            if course_card.course_data in self.selected_courses:
-                self.selected_courses.remove(course_card.course_data)
+            self.selected_courses.pop(_course_key(course), None)
         
         self._update_selection_info()
     
@@ -1132,21 +1545,13 @@ class MainGUI:
         """Handle select all button click."""
         all_selected = len(self.selected_courses) == len(self.filtered_courses)
         
-        # Clear current selection
+        # Update the selection, then refresh the rows currently on screen
         self.selected_courses.clear()
+        if not all_selected:
+            self.selected_courses.update((_course_key(course), course) for course in self.filtered_courses)
         
-        # Update all checkboxes
-        for widget in self.courses_scrollable.winfo_children():
-            if hasattr(widget, 'checkbox_var'):
-                if all_selected:
-                    widget.checkbox_var.set(False)
-                    widget.selected = False
-                    widget.configure(fg_color=["gray86", "gray17"])
-                else:
-                    widget.checkbox_var.set(True)
-                    widget.selected = True
-                    widget.configure(fg_color=COLORS['primary'])
-                    self.selected_courses.append(widget.course_data)
+        if self._row_pool and self._list_message is None:
+            self._render_window(self._first_row)
         
         self._update_selection_info()
     
@@ -1163,14 +1568,13 @@ class MainGUI:
         )
         
         if result:
-            self._enroll_in_courses(self.selected_courses)
+            self._enroll_in_courses(list(self.selected_courses.values()))
     
     def _on_view_course(self, course):
         """Handle view course button click."""
         course_url = course.get('url', '')
         if course_url:
             try:
-                import webbrowser
                 webbrowser.open(course_url)
             except Exception as e:
                 messagebox.showerror("Error", f"Could not open course URL: {str(e)}")
@@ -1178,40 +1582,70 @@ class MainGUI:
             messagebox.showwarning("No URL", "Course URL not available")
     
     def _on_sort_changed(self, sort_option):
-        """Handle sort option change."""
+        """Handle sort option change, applying only the last of quick successive picks."""
+        if self._sort_after_id is not None:
+            self.window.after_cancel(self._sort_after_id)
+        
+        self._sort_after_id = self.window.after(SORT_DEBOUNCE_MS, self._apply_sort, sort_option)
+    
+    def _apply_sort(self, sort_option):
+        """Re-order the filtered courses by the given sort option."""
+        self._sort_after_id = None
+        
         if not self.filtered_courses:
             return
         
         try:
-            if sort_option == "Rating":
-                self.filtered_courses.sort(key=lambda x: float(x.get('rating', 0)), reverse=True)
-            elif sort_option == "Duration":
-                self.filtered_courses.sort(key=lambda x: self._parse_duration(x.get('duration', '')))
-            elif sort_option == "Title":
-                self.filtered_courses.sort(key=lambda x: x.get('title', '').lower())
-            else:  # Recent
-                pass  # Keep original order
-            
+            self._refresh_filtered_courses(sort_option)
             self._update_course_display()
             self._show_status(f"Sorted by {sort_option}")
         except Exception as e:
             logger.error(f"Error sorting courses: {str(e)}")
     
-    def _parse_duration(self, duration_str):
-        """Parse duration string to hours for sorting."""
-        if not duration_str:
-            return 0
+    def _refresh_filtered_courses(self, sort_option: Optional[str] = None):
+        """
+        Rebuild filtered_courses from the filter mask in sorted order.
         
-        try:
-            # Extract numbers from duration string
-            import re
-            numbers = re.findall(r'\d+', str(duration_str))
-            if numbers:
-                return float(numbers[0])
-        except:
-            pass
+        Args:
+            sort_option: Sort option to use, defaults to the dropdown value
+        """
+        order = self._get_sort_order(sort_option or self.sort_var.get())
+        mask = self._filter_mask
+        courses = self.all_courses
         
-        return 0
+        if mask is None:
+            self.filtered_courses = [courses[i] for i in order]
+        else:
+            self.filtered_courses = [courses[i] for i in order if i in mask]
+    
+    def _get_sort_order(self, sort_option: str):
+        """
+        Get the permutation of all_courses for a sort option.
+        
+        Each permutation is computed once per fetched course list, so switching
+        sort options or filters afterwards needs no sorting at all.
+        """
+        order = self._sort_orders.get(sort_option)
+        if order is not None:
+            return order
+        
+        courses = self.all_courses
+        indices = range(len(courses))
+        
+        if sort_option == "Rating":
+            ratings = self._course_columns['ratings']
+            order = sorted(indices, key=ratings.__getitem__, reverse=True)
+        elif sort_option == "Duration":
+            durations = [_parse_duration(course.get('duration', '')) for course in courses]
+            order = sorted(indices, key=durations.__getitem__)
+        elif sort_option == "Title":
+            titles = self._course_columns['titles']
+            order = sorted(indices, key=titles.__getitem__)
+        else:  # Recent
+            order = list(indices)  # Original order
+        
+        self._sort_orders[sort_option] = order
+        return order
     
     def _on_refresh(self):
         """Handle refresh button click."""
@@ -1224,8 +1658,6 @@ class MainGUI:
             return
         
         try:
-            from tkinter import filedialog
-            
             filename = filedialog.asksaveasfilename(
                 defaultextension=".json",
                 filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
@@ -1233,16 +1665,38 @@ class MainGUI:
             )
             
             if filename:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(self.filtered_courses, f, indent=2, ensure_ascii=False)
-                
-                messagebox.showinfo("Export Success", f"Courses exported to {filename}")
-                self._show_status(f"Exported {len(self.filtered_courses)} courses")
+                # Serialize and write in the background on a snapshot of the list
+                self._show_status(f"Exporting {len(self.filtered_courses)} courses...", status_type="loading")
+                self._executor.submit(self._export_courses_thread, filename, list(self.filtered_courses))
         except Exception as e:
             error_msg = f"Export failed: {str(e)}"
             logger.error(error_msg)
             messagebox.showerror("Export Error", error_msg)
     
+    def _export_courses_thread(self, filename: str, courses: List[Dict]):
+        """Write exported courses to disk in background thread."""
+        try:
+            data = json.dumps(courses, indent=2, ensure_ascii=False)
+            with open(filename, 'w', encoding='utf-8') as f:
+                f.write(data)
+            
+            self._post_to_ui(self._on_export_complete, filename, len(courses))
+        
+        except Exception as e:
+            error_msg = f"Export failed: {str(e)}"
+            logger.error(error_msg)
+            self._post_to_ui(self._on_export_error, error_msg)
+    
+    def _on_export_complete(self, filename: str, count: int):
+        """Handle successful course export."""
+        self._show_status(f"Exported {count} courses", status_type="success")
+        messagebox.showinfo("Export Success", f"Courses exported to {filename}")
+    
+    def _on_export_error(self, error_msg: str):
+        """Handle course export error."""
+        self._show_status(error_msg, status_type="error")
+        messagebox.showerror("Export Error", error_msg)
+    
     def _toggle_theme(self):
         """Toggle between light and dark theme."""
         current_mode = ctk.get_appearance_mode()
@@ -1261,17 +1715,22 @@ class MainGUI:
         count = len(self.selected_courses)
         
         if count == 0:
-            self.selection_label.configure(text="No courses selected")
-            self.enroll_selected_btn.configure(state="disabled")
-            self.select_all_btn.configure(text="Select All")
+            selection_info = ("No courses selected", "disabled", "Select All")
         elif count == len(self.filtered_courses):
-            self.selection_label.configure(text=f"All {count} courses selected")
-            self.enroll_selected_btn.configure(state="normal")
-            self.select_all_btn.configure(text="Deselect All")
+            selection_info = (f"All {count} courses selected", "normal", "Deselect All")
         else:
-            self.selection_label.configure(text=f"{count} of {len(self.filtered_courses)} courses selected")
-            self.enroll_selected_btn.configure(state="normal")
-            self.select_all_btn.configure(text="Select All")
+            selection_info = (f"{count} of {len(self.filtered_courses)} courses selected", "normal", "Select All")
+        
+        # Each configure redraws the widget, so skip them if nothing changed
+        if selection_info == self._selection_info:
+            return
+        
+        label_text, enroll_state, select_all_text = selection_info
+        self._selection_info = selection_info
+        
+        self.selection_label.configure(text=label_text)
+        self.enroll_selected_btn.configure(state=enroll_state)
+        self.select_all_btn.configure(text=select_all_text)
     
     def _update_course_count(self):
         """Update course count display."""
@@ -1304,21 +1763,29 @@ class MainGUI:
         if result:
             self._enroll_in_courses(self.filtered_courses)
     
+    def _on_enroll_single(self, index: int):
+        """Handle a course row's enroll button."""
+        if self.is_enrolling or not 0 <= index < len(self.filtered_courses):
+            return
+        
+        self._enroll_in_courses([self.filtered_courses[index]])
+    
     def _enroll_in_courses(self, courses: List[Dict]):
         """Enroll in multiple courses."""
         if self.is_enrolling:
             return
         
         self.is_enrolling = True
-        self.enroll_button.configure(text="Enrolling...", state="disabled")
-        self._show_status("Starting enrollment process...", show_progress=True)
+        self.enrollment_results = {}
+        self._enroll_total = len(courses)
+        self.enroll_button.configure(text="⚡ Enrolling...", state="disabled")
+        self._show_status(f"Starting enrollment in {len(courses)} courses...", show_progress=True, status_type="loading")
         
-        # Start enrollment in separate thread
-        thread = threading.Thread(target=self._enroll_courses_thread, args=(courses,))
-        thread.daemon = True
-        thread.start()
+        # Run enrollment on the shared background executor
+        max_concurrency = int(self.concurrency_var.get())
+        self._executor.submit(self._enroll_courses_thread, courses, max_concurrency)
     
-    def _enroll_courses_thread(self, courses: List[Dict]):
+    def _enroll_courses_thread(self, courses: List[Dict], max_concurrency: int = 1):
         """Enroll in courses in background thread."""
         try:
             # Import here to avoid circular imports
@@ -1330,6 +1797,7 @@ class MainGUI:
             enroller = UdemyEnroller()
             enroller.session = self.session
             enroller.user_info = self.user_info
+            self._enroller = enroller
             
             # Extract course URLs
             course_urls = [course.get('url') for course in courses if course.get('url')]
@@ -1338,15 +1806,52 @@ class MainGUI:
                 raise Exception("No valid course URLs found")
             
             # Enroll in courses
-            results = enroller.enroll_in_multiple_courses(course_urls)
+            results = enroller.enroll_in_multiple_courses(
+                course_urls,
+                progress_callback=self._queue_enroll_update,
+                max_concurrency=max_concurrency
+            )
             
             # Update UI in main thread
-            self.window.after(0, lambda: self._on_enrollment_complete(results))
+            self._post_to_ui(self._on_enrollment_complete, results)
             
         except Exception as e:
             error_msg = f"Error during enrollment: {str(e)}"
             logger.error(error_msg)
-            self.window.after(0, lambda: self._on_enrollment_error(error_msg))
+            self._post_to_ui(self._on_enrollment_error, error_msg)
+    
+    def _queue_enroll_update(self, course_url: str, result: Dict):
+        """
+        Queue a per-course enrollment result from the worker thread.
+        
+        Results are applied together on the next UI tick rather than one
+        redraw per course.
+        """
+        with self._enroll_updates_lock:
+            self._pending_enroll_updates.append((course_url, result))
+            if self._enroll_tick_scheduled:
+                return
+            self._enroll_tick_scheduled = True
+        
+        self._post_to_ui(self.window.after, ENROLL_UPDATE_INTERVAL_MS, self._flush_enroll_updates)
+    
+    def _flush_enroll_updates(self):
+        """Apply all queued enrollment results with a single UI update."""
+        with self._enroll_updates_lock:
+            updates = self._pending_enroll_updates
+            self._pending_enroll_updates = []
+            self._enroll_tick_scheduled = False
+        
+        # The final results may already have been shown
+        if not self.is_enrolling:
+            return
+        
+        self.enrollment_results.update(updates)
+        processed = len(self.enrollment_results)
+        
+        self.status_label.configure(text=f"Enrolling... {processed}/{self._enroll_total} courses processed")
+        self.progress_bar.set(processed / max(self._enroll_total, 1))
+        self._update_stats()
     
     def _on_enrollment_complete(self, results: Dict):
         """Handle successful completion of enrollment."""
@@ -1357,10 +1862,23 @@ class MainGUI:
         total = len(results)
         
         self.is_enrolling = False
-        self.enroll_button.configure(text="Enroll All", state="normal")
+        self.enroll_button.configure(text="⚡ Enroll All", state="normal")
+        
+        # Show success status
+        if successful == total:
+            status_msg = f"Perfect! All {total} courses enrolled successfully!"
+            status_type = "success"
+        elif successful > 0:
+            status_msg = f"Partially complete: {successful}/{total} courses enrolled"
+            status_type = "warning"
+        else:
+            status_msg = f"No courses enrolled successfully"
+            status_type = "error"
         
-        status_msg = f"Enrollment complete: {successful}/{total} successful"
-        self._show_status(status_msg, show_progress=False)
+        self._show_status(status_msg, status_type=status_type)
+        
+        # Update statistics
+        self._update_stats()
         
         # Show detailed results
         self._show_enrollment_results(results)
@@ -1370,10 +1888,10 @@ class MainGUI:
     def _on_enrollment_error(self, error_msg: str):
         """Handle enrollment error."""
         self.is_enrolling = False
-        self.enroll_button.configure(text="Enroll All", state="normal")
-        self._show_status(f"Enrollment error: {error_msg}", show_progress=False)
+        self.enroll_button.configure(text="⚡ Enroll All", state="normal")
+        self._show_status(f"Enrollment failed: {error_msg}", status_type="error")
         
-        messagebox.showerror("Enrollment Error", error_msg)
+        messagebox.showerror("Enrollment Error", f"Enrollment process failed:\n\n{error_msg}")
     
     def _show_enrollment_results(self, results: Dict):
         """Show detailed enrollment results in a dialog."""
@@ -1385,18 +1903,19 @@ class MainGUI:
         results_text = ctk.CTkTextbox(results_window, width=580, height=350)
         results_text.pack(padx=10, pady=10)
         
-        # Format results
-        text_content = "Enrollment Results:\n\n"
+        # Format results as lines and insert them with a single call
+        lines = ["Enrollment Results:", ""]
         
         for url, result in results.items():
             success = result.get('success', False)
             message = result.get('message', 'No message')
             
             status = "✓ SUCCESS" if success else "✗ FAILED"
-            text_content += f"{status}: {message}\n"
-            text_content += f"URL: {url}\n\n"
+            lines.append(f"{status}: {message}")
+            lines.append(f"URL: {url}")
+            lines.append("")
         
-        results_text.insert("0.0", text_content)
+        results_text.insert("0.0", "\n".join(lines) + "\n")
         results_text.configure(state="disabled")
         
         # Close button
@@ -1411,49 +1930,52 @@ class MainGUI:
     def _update_stats(self):
         """Update the statistics display with modern cards."""
         if not self.all_courses:
-            self.total_stat.value_label.configure(text="0")
-            self.filtered_stat.value_label.configure(text="0")
-            self.success_stat.value_label.configure(text="0%")
+            self._set_stat_value(self.total_stat, "0")
+            self._set_stat_value(self.filtered_stat, "0")
+            self._set_stat_value(self.success_stat, "0%")
             return
         
         total = len(self.all_courses)
         filtered = len(self.filtered_courses)
         
         # Update statistics
-        self.total_stat.value_label.configure(text=str(total))
-        self.filtered_stat.value_label.configure(text=str(filtered))
+        self._set_stat_value(self.total_stat, str(total))
+        self._set_stat_value(self.filtered_stat, str(filtered))
         
         # Calculate success rate from previous enrollment results
         if self.enrollment_results:
             successful = sum(1 for r in self.enrollment_results.values() if r.get('success', False))
             total_enrolled = len(self.enrollment_results)
             success_rate = (successful / total_enrolled * 100) if total_enrolled > 0 else 0
-            self.success_stat.value_label.configure(text=f"{success_rate:.1f}%")
+            self._set_stat_value(self.success_stat, f"{success_rate:.1f}%")
         else:
-            self.success_stat.value_label.configure(text="0%")
+            self._set_stat_value(self.success_stat, "0%")
         
         # Update course count display
         self._update_course_count()
     
+    def _set_stat_value(self, stat_card, text: str):
+        """Set a statistics card value, skipping the redraw if it is unchanged."""
+        if stat_card.value_text != text:
+            stat_card.value_text = text
+            stat_card.value_label.configure(text=text)
+    
     def _show_status(self, message: str, show_progress: bool = False, status_type: str = "info"):
         """Update status message with icon and optionally show progress bar."""
-        # Status icons
-        icons = {
-            "info": "ℹ️",
-            "success": "✅",
-            "warning": "⚠️",
-            "error": "❌",
-            "loading": "⏳"
-        }
+        icon, color_key = STATUS_STYLES.get(status_type, STATUS_STYLES['info'])
+        if show_progress:
+            icon = STATUS_STYLES['loading'][0]
         
-        # Update status
-        self.status_icon.configure(text=icons.get(status_type, "ℹ️"))
+        # Update status; icon and color only change with the status type
+        if (icon, color_key) != self._status_style:
+            self._status_style = (icon, color_key)
+            self.status_icon.configure(text=icon)
+            self.status_label.configure(text_color=COLORS[color_key])
         self.status_label.configure(text=message)
         
         if show_progress:
             self.progress_bar.pack(side="right", padx=(SPACING['sm'], 0))
             self.progress_bar.set(0.5)  # Indeterminate progress
-            self.status_icon.configure(text="⏳")
         else:
             self.progress_bar.pack_forget()
         
@@ -1478,58 +2000,62 @@ class MainGUI:
             self._show_status("Debug mode disabled", status_type="info")
     
     def _show_debug_panel(self):
-        """Show the debug panel."""
+        """Show the debug panel, building it on first use."""
         if self.debug_panel is None:
-            # Create debug panel
-            self.debug_panel = ctk.CTkFrame(self.window, height=200, corner_radius=8)
-            self.debug_panel.grid(row=3, column=0, sticky="ew", padx=SPACING['md'], pady=(0, SPACING['md']))
-            self.debug_panel.grid_propagate(False)
-            
-            # Debug panel header
-            debug_header = ctk.CTkFrame(self.debug_panel, fg_color="transparent", height=40)
-            debug_header.pack(fill="x", padx=SPACING['md'], pady=(SPACING['sm'], 0))
-            debug_header.pack_propagate(False)
-            
-            debug_title = ctk.CTkLabel(
-                debug_header,
-                text="🐛 Debug Console",
-                font=FONTS['body_large'],
-                text_color=COLORS['warning']
-            )
-            debug_title.pack(side="left", pady=SPACING['sm'])
-            
-            # Clear button
-            clear_btn = ctk.CTkButton(
-                debug_header,
-                text="Clear",
-                command=self._clear_debug,
-                width=60,
-                height=28,
-                font=FONTS['label'],
-                fg_color="transparent",
-                hover_color=COLORS['surface_variant'],
-                text_color=COLORS['on_surface_variant'],
-                border_width=1,
-                border_color=COLORS['outline']
-            )
-            clear_btn.pack(side="right", pady=SPACING['sm'])
-            
-            # Debug text area
-            self.debug_text = ctk.CTkTextbox(
-                self.debug_panel,
-                height=150,
-                font=("Courier New", 10),
-                wrap="word"
-            )
-            self.debug_text.pack(fill="both", expand=True, padx=SPACING['md'], pady=(0, SPACING['md']))
-            
-            # Add initial debug info
-            self._add_debug_message("Debug mode enabled")
-            self._add_debug_message(f"Session: {'Active' if self.session else 'Not active'}")
-            self._add_debug_message(f"User: {self.user_info.get('display_name', 'Unknown') if self.user_info else 'Not logged in'}")
+            self._build_debug_panel()
         else:
             self.debug_panel.grid()
     
+    def _build_debug_panel(self):
+        """Build the debug panel widgets; deferred until debug mode is first enabled."""
+        # Create debug panel
+        self.debug_panel = ctk.CTkFrame(self.window, height=200, corner_radius=8)
+        self.debug_panel.grid(row=3, column=0, sticky="ew", padx=SPACING['md'], pady=(0, SPACING['md']))
+        self.debug_panel.grid_propagate(False)
+        
+        # Debug panel header
+        debug_header = ctk.CTkFrame(self.debug_panel, fg_color="transparent", height=40)
+        debug_header.pack(fill="x", padx=SPACING['md'], pady=(SPACING['sm'], 0))
+        debug_header.pack_propagate(False)
+        
+        debug_title = ctk.CTkLabel(
+            debug_header,
+            text="🐛 Debug Console",
+            font=self.fonts['body_large'],
+            text_color=COLORS['warning']
+        )
+        debug_title.pack(side="left", pady=SPACING['sm'])
+        
+        # Clear button
+        clear_btn = ctk.CTkButton(
+            debug_header,
+            text="Clear",
+            command=self._clear_debug,
+            width=60,
+            height=28,
+            font=self.fonts['label'],
+            fg_color="transparent",
+            hover_color=COLORS['surface_variant'],
+            text_color=COLORS['on_surface_variant'],
+            border_width=1,
+            border_color=COLORS['outline']
+        )
+        clear_btn.pack(side="right", pady=SPACING['sm'])
+        
+        # Debug text area
+        self.debug_text = ctk.CTkTextbox(
+            self.debug_panel,
+            height=150,
+            font=("Courier New", 10),
+            wrap="word"
+        )
+        self.debug_text.pack(fill="both", expand=True, padx=SPACING['md'], pady=(0, SPACING['md']))
+        
+        # Add initial debug info
+        self._add_debug_message("Debug mode enabled")
+        self._add_debug_message(f"Session: {'Active' if self.session else 'Not active'}")
+        self._add_debug_message(f"User: {self.user_info.get('display_name', 'Unknown') if self.user_info else 'Not logged in'}")
+    
     def _hide_debug_panel(self):
         """Hide the debug panel."""
         if self.debug_panel:
@@ -1537,15 +2063,38 @@ class MainGUI:
     
     def _clear_debug(self):
         """Clear debug console."""
+        self._debug_buffer.clear()
         if self.debug_text:
             self.debug_text.delete("0.0", "end")
     
     def _add_debug_message(self, message):
-        """Add a message to the debug console."""
+        """Queue a message for the debug console; written on the next flush."""
         if self.debug_text and self.debug_mode:
+            from datetime import datetime
+            
             timestamp = datetime.now().strftime("%H:%M:%S")
-            self.debug_text.insert("end", f"[{timestamp}] {message}\n")
-            self.debug_text.see("end")
+            self._debug_buffer.append(f"[{timestamp}] {message}")
+            
+            if self._debug_flush_id is None:
+                self._debug_flush_id = self.window.after(DEBUG_FLUSH_MS, self._flush_debug)
+    
+    def _flush_debug(self):
+        """Write buffered debug messages with one insert and trim old lines."""
+        self._debug_flush_id = None
+        if not self._debug_buffer:
+            return
+        
+        lines = "\n".join(self._debug_buffer) + "\n"
+        self._debug_buffer.clear()
+        self.debug_text.insert("end", lines)
+        
+        # Each message ends in a newline and Tk adds one more, so the "end"
+        # index's line number is the message line count + 2
+        excess = int(self.debug_text.index("end").split(".")[0]) - 2 - DEBUG_MAX_LINES
+        if excess > 0:
+            self.debug_text.delete("1.0", f"{excess + 1}.0")
+        
+        self.debug_text.see("end")
     
     def _on_window_close(self):
         """Handle window close event."""
@@ -1553,6 +2102,16 @@ class MainGUI:
             if not messagebox.askokcancel("Quit", "Operations are in progress. Are you sure you want to quit?"):
                 return
         
+        # Drop queued work and stop running scrapes and enrollments; the
+        # executor's threads are joined at exit, so the process only lives
+        # on until their current request completes
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        if self._scraper is not None:
+            self._scraper.stop()
+        if self._enroller is not None:
+            self._enroller.stop()
+        if self._ui_poll_id is not None:
+            self.window.after_cancel(self._ui_poll_id)
         self.window.destroy()
     
     def show(self):
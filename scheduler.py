@@ -6,15 +6,22 @@ This module provides scheduled task functionality for the Udemy Course Enroller.
 It can automatically fetch and enroll in courses at specified times.
 """
 
+import atexit
+import hashlib
 import logging
+import signal
 import threading
 import time
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from logging.handlers import TimedRotatingFileHandler
 from typing import Callable, Optional
 
 import schedule
 from plyer import notification
 
+from filters import filter_courses
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -22,6 +29,44 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Scheduler log file, rotated at midnight and kept for a week
+SCHEDULER_LOG_FILE = "udemy_scheduler.log"
+LOG_BACKUP_COUNT = 7
+
+# Upper bound on how long the scheduler loop sleeps between checks
+MAX_IDLE_SECONDS = 3600
+
+# Retry delays after errors in the scheduler loop, doubling per failure
+ERROR_BACKOFF_BASE = 5
+ERROR_BACKOFF_MAX = 600
+
+# Number of scheduled enrollments processed in parallel
+ENROLL_CONCURRENCY = 4
+
+# Seconds to wait for all scrape sources before giving up on slow ones
+FETCH_TIMEOUT = 120
+
+# Seconds a filter result is reused for the same set of course URLs
+FILTER_CACHE_TTL = 3600
+
+# Default filter keywords for scheduled runs (programming focus, no beginner courses)
+DEFAULT_KEYWORDS = ['python', 'javascript', 'programming', 'development', 'web']
+DEFAULT_EXCLUDE_KEYWORDS = ['beginner', 'basic', 'intro']
+
+# Minimum seconds between non-forced desktop notifications
+NOTIFY_MIN_INTERVAL = 5.0
+
+# Desktop notifier with the application name pre-filled
+_notify = partial(notification.notify, app_name="Udemy Course Enroller")
+
+# Seconds stop_scheduler waits for the scheduler thread to finish
+STOP_JOIN_TIMEOUT = 5
+
+# Day names accepted by schedule_weekly_at
+WEEKDAYS = frozenset({
+    'monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday'
+})
+
 
 class UdemyScheduler:
     """
@@ -47,21 +92,47 @@ class UdemyScheduler:
         self.is_running = False
         self.scheduler_thread = None
         
+        # Set to wake the scheduler loop early (stop or schedule change)
+        self._wake = threading.Event()
+        self._consecutive_errors = 0
+        
+        # Filter results keyed by a digest of the input course URLs
+        self._filter_cache = {}
+        
+        # Created on first use and reused across runs to keep their
+        # connection pools (and the enroller's enrolled-course set) warm
+        self._scraper = None
+        self._enroller = None
+        
+        # Runs the scrape sources concurrently; created with the scraper
+        self._fetch_executor = None
+        
+        # Time of the last desktop notification, for throttling
+        self._last_notify = 0.0
+        
+        # Held while a run_now() run is in progress
+        self._run_now_lock = threading.Lock()
+        
         # Setup logging to file
         self._setup_file_logging()
     
     def _setup_file_logging(self):
-        """Setup file logging for scheduled events."""
-        today = datetime.now().strftime('%Y-%m-%d')
-        log_filename = f"udemy_scheduler_{today}.log"
+        """Setup file logging for scheduled events (once per process)."""
+        if any(isinstance(h, TimedRotatingFileHandler) for h in logger.handlers):
+            return
         
-        file_handler = logging.FileHandler(log_filename)
+        file_handler = TimedRotatingFileHandler(
+            SCHEDULER_LOG_FILE,
+            when='midnight',
+            backupCount=LOG_BACKUP_COUNT,
+            encoding='utf-8'
+        )
         file_handler.setLevel(logging.INFO)
         formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
         file_handler.setFormatter(formatter)
         
         logger.addHandler(file_handler)
-        logger.info(f"Scheduler logging to: {log_filename}")
+        logger.info(f"Scheduler logging to: {SCHEDULER_LOG_FILE}")
     
     def fetch_and_enroll(self):
         """
@@ -71,13 +142,6 @@ class UdemyScheduler:
         try:
             logger.info("Starting scheduled fetch and enroll process")
             
-            # Send notification that process is starting
-            self._send_notification(
-                "Udemy Enroller",
-                "Starting scheduled course fetching and enrollment",
-                timeout=5
-            )
-            
             # Fetch courses
             logger.info("Fetching courses from all sources")
             courses = self._fetch_courses()
@@ -108,10 +172,9 @@ class UdemyScheduler:
             
             # Enroll in filtered courses
             logger.info("Starting enrollment process")
-            results = self._enroll_in_courses(filtered_courses)
+            results, successful = self._enroll_in_courses(filtered_courses)
             
             # Process results
-            successful = sum(1 for r in results.values() if r.get('success', False))
             total = len(results)
             
             # Log results
@@ -121,16 +184,10 @@ class UdemyScheduler:
             self._send_notification(
                 "Udemy Enroller - Complete",
                 f"Enrolled in {successful}/{total} courses",
-                timeout=10
+                timeout=10,
+                force=True
             )
             
-            # Log individual results
-            for url, result in results.items():
-                if result.get('success', False):
-                    logger.info(f"✓ SUCCESS: {result.get('message', 'Enrolled successfully')}")
-                else:
-                    logger.warning(f"✗ FAILED: {result.get('message', 'Enrollment failed')}")
-            
         except Exception as e:
             error_msg = f"Error in scheduled fetch and enroll: {str(e)}"
             logger.error(error_msg)
@@ -139,18 +196,29 @@ class UdemyScheduler:
             self._send_notification(
                 "Udemy Enroller - Error",
                 f"Scheduled task failed: {str(e)}",
-                timeout=15
+                timeout=15,
+                force=True
             )
     
     def _fetch_courses(self):
         """Fetch courses from all sources."""
         try:
-            from udemy_coupon_scraper import UdemyCouponScraper
+            if self._scraper is None:
+                from udemy_coupon_scraper import UdemyCouponScraper
+                self._scraper = UdemyCouponScraper()
+            scraper = self._scraper
+            
+            if self._fetch_executor is None:
+                self._fetch_executor = ThreadPoolExecutor(
+                    max_workers=len(scraper.sources),
+                    thread_name_prefix="fetch"
+                )
             
-            scraper = UdemyCouponScraper()
-            courses = scraper.get_all_courses()
+            # Scrape all sources concurrently; a slow source only loses its
+            # own courses
+            course_lists = scraper.iter_courses(self._fetch_executor, timeout=FETCH_TIMEOUT)
             
-            return courses
+            return scraper.merge_courses(course_lists)
             
         except Exception as e:
             logger.error(f"Error fetching courses: {e}")
@@ -158,51 +226,100 @@ class UdemyScheduler:
     
     def _apply_default_filters(self, courses):
         """Apply default filters to reduce the number of courses."""
+        if not courses:
+            return []
+        
         try:
-            from filters import filter_courses
+            key = hashlib.blake2b(
+                b"\n".join(sorted((course.get('url') or '').encode() for course in courses)),
+                digest_size=16
+            ).hexdigest()
+            now = time.monotonic()
+            
+            cached = self._filter_cache.get(key)
+            if cached and now - cached[0] < FILTER_CACHE_TTL:
+                logger.info("Reusing filter result for unchanged course list")
+                return list(cached[1])
             
             # Apply reasonable defaults to avoid enrolling in too many courses
             filtered = filter_courses(
                 courses,
                 min_rating=4.0,  # Only high-rated courses
                 max_duration=10.0,  # Maximum 10 hours
-                keywords=['python', 'javascript', 'programming', 'development', 'web'],  # Programming focus
-                exclude_keywords=['beginner', 'basic', 'intro']  # Exclude beginner courses
+                keywords=DEFAULT_KEYWORDS,
+                exclude_keywords=DEFAULT_EXCLUDE_KEYWORDS
             )
             
             # Limit to maximum 10 courses per day
-            return filtered[:10]
+            filtered = filtered[:10]
+            
+            # Drop expired entries before storing the new one
+            self._filter_cache = {
+                k: entry for k, entry in self._filter_cache.items()
+                if now - entry[0] < FILTER_CACHE_TTL
+            }
+            self._filter_cache[key] = (now, filtered)
+            
+            return list(filtered)
             
         except Exception as e:
             logger.error(f"Error applying filters: {e}")
             return courses[:5]  # Fallback to first 5 courses
     
     def _enroll_in_courses(self, courses):
-        """Enroll in the given courses."""
+        """
+        Enroll in the given courses.
+        
+        Returns:
+            tuple: (results by course URL, number of successful enrollments)
+        """
         try:
-            from udemy_enroller import UdemyEnroller
-            
-            enroller = UdemyEnroller()
+            if self._enroller is None:
+                from udemy_enroller import UdemyEnroller
+                self._enroller = UdemyEnroller()
+            enroller = self._enroller
             enroller.session = self.session
             enroller.user_info = self.user_info
             
             # Extract course URLs
-            course_urls = [course.get('url') for course in courses if course.get('url')]
+            course_urls = [url for url in (course.get('url') for course in courses) if url]
             
             if not course_urls:
                 logger.warning("No valid course URLs found")
-                return {}
+                return {}, 0
+            
+            # Log and count results as each enrollment finishes
+            succeeded = []
+            
+            def on_result(course_url, result):
+                self._log_enrollment_result(course_url, result)
+                # Submitted courses are reported again once verified
+                if result.get('success', False) and not result.get('pending', False):
+                    succeeded.append(course_url)
             
             # Enroll in courses
-            results = enroller.enroll_in_multiple_courses(course_urls)
+            results = enroller.enroll_in_multiple_courses(
+                course_urls,
+                progress_callback=on_result,
+                max_concurrency=ENROLL_CONCURRENCY
+            )
             
-            return results
+            return results, len(succeeded)
             
         except Exception as e:
             logger.error(f"Error enrolling in courses: {e}")
-            return {}
+            return {}, 0
+    
+    def _log_enrollment_result(self, course_url: str, result: dict):
+        """Log a single enrollment result (called from enrollment workers)."""
+        if result.get('pending', False):
+            logger.info(f"… SUBMITTED: {result.get('message', 'Awaiting verification')}")
+        elif result.get('success', False):
+            logger.info(f"✓ SUCCESS: {result.get('message', 'Enrolled successfully')}")
+        else:
+            logger.warning(f"✗ FAILED: {result.get('message', 'Enrollment failed')}")
     
-    def _send_notification(self, title: str, message: str, timeout: int = 10):
+    def _send_notification(self, title: str, message: str, timeout: int = 10, force: bool = False):
         """
         Send desktop notification.
         
@@ -210,14 +327,17 @@ class UdemyScheduler:
             title: Notification title
             message: Notification message
             timeout: Notification timeout in seconds
+            force: Send even if another notification went out within
+                NOTIFY_MIN_INTERVAL seconds
         """
+        now = time.monotonic()
+        if not force and now - self._last_notify < NOTIFY_MIN_INTERVAL:
+            logger.info(f"Skipped notification: {title} - {message}")
+            return
+        self._last_notify = now
+        
         try:
-            notification.notify(
-                title=title,
-                message=message,
-                timeout=timeout,
-                app_name="Udemy Course Enroller"
-            )
+            _notify(title=title, message=message, timeout=timeout)
             logger.info(f"Sent notification: {title} - {message}")
             
         except Exception as e:
@@ -232,6 +352,7 @@ class UdemyScheduler:
         """
         try:
             schedule.every().day.at(time_str).do(self.fetch_and_enroll)
+            self._wake.set()
             logger.info(f"Scheduled daily fetch and enroll at {time_str}")
             
         except Exception as e:
@@ -246,8 +367,13 @@ class UdemyScheduler:
             time_str: Time in HH:MM format (24-hour)
         """
         try:
-            day_method = getattr(schedule.every(), day.lower())
+            day_name = day.lower()
+            if day_name not in WEEKDAYS:
+                raise ValueError(f"invalid day of the week: {day!r}")
+            
+            day_method = getattr(schedule.every(), day_name)
             day_method.at(time_str).do(self.fetch_and_enroll)
+            self._wake.set()
             logger.info(f"Scheduled weekly fetch and enroll on {day} at {time_str}")
             
         except Exception as e:
@@ -257,6 +383,10 @@ class UdemyScheduler:
         """
         Add a custom schedule function.
         
+        The scheduler loop sleeps until the next known job is due, so jobs
+        registered directly on ``schedule`` while it runs are only picked up
+        after that; add them through this method, which wakes the loop.
+        
         Args:
             schedule_func: Function that sets up the schedule
         """
@@ -264,6 +394,9 @@ class UdemyScheduler:
             schedule_func()
             logger.info("Added custom schedule")
             
+            # Re-plan the loop's sleep around the new job
+            self._wake.set()
+            
         except Exception as e:
             logger.error(f"Error adding custom schedule: {e}")
     
@@ -277,6 +410,9 @@ class UdemyScheduler:
         self.scheduler_thread = threading.Thread(target=self._run_scheduler, daemon=True)
         self.scheduler_thread.start()
         
+        # Stop cleanly on interpreter exit instead of killing the daemon thread
+        atexit.register(self._stop_at_exit)
+        
         logger.info("Scheduler started in background thread")
         
         # Send startup notification
@@ -294,6 +430,16 @@ class UdemyScheduler:
         
         self.is_running = False
         schedule.clear()
+        self._wake.set()
+        atexit.unregister(self._stop_at_exit)
+        
+        # Let an in-progress job finish (not possible from a job itself)
+        if self.scheduler_thread is not threading.current_thread():
+            self.scheduler_thread.join(timeout=STOP_JOIN_TIMEOUT)
+        
+        if self._fetch_executor is not None:
+            self._fetch_executor.shutdown(wait=False, cancel_futures=True)
+            self._fetch_executor = None
         
         logger.info("Scheduler stopped")
         
@@ -304,6 +450,11 @@ class UdemyScheduler:
             timeout=5
         )
     
+    def _stop_at_exit(self):
+        """atexit hook: stop the scheduler if it is still running."""
+        if self.is_running:
+            self.stop_scheduler()
+    
     def _run_scheduler(self):
         """Main scheduler loop running in background thread."""
         logger.info("Scheduler loop started")
@@ -311,11 +462,25 @@ class UdemyScheduler:
         while self.is_running:
             try:
                 schedule.run_pending()
-                time.sleep(60)  # Check every minute
+                self._consecutive_errors = 0
+                
+                # Sleep until the next job is due instead of polling
+                idle = schedule.idle_seconds()
+                if idle is None:
+                    idle = MAX_IDLE_SECONDS
+                if idle > 0:
+                    self._wake.wait(timeout=min(idle, MAX_IDLE_SECONDS))
+                self._wake.clear()
                 
             except Exception as e:
-                logger.error(f"Error in scheduler loop: {e}")
-                time.sleep(300)  # Wait 5 minutes before retrying
+                self._consecutive_errors += 1
+                backoff = min(
+                    ERROR_BACKOFF_MAX,
+                    ERROR_BACKOFF_BASE * 2 ** self._consecutive_errors
+                )
+                logger.error(f"Error in scheduler loop: {e} (retrying in {backoff}s)")
+                self._wake.wait(timeout=backoff)
+                self._wake.clear()
     
     def get_scheduled_jobs(self):
         """Get list of scheduled jobs."""
@@ -323,18 +488,31 @@ class UdemyScheduler:
     
     def run_now(self):
         """Run the fetch and enroll process immediately."""
+        if not self._run_now_lock.acquire(blocking=False):
+            logger.warning("Fetch and enroll process is already running")
+            return
+        
         logger.info("Running fetch and enroll process immediately")
         
         # Run in separate thread to avoid blocking
-        thread = threading.Thread(target=self.fetch_and_enroll, daemon=True)
+        thread = threading.Thread(target=self._run_now_and_release, daemon=True)
         thread.start()
+        self._wake.set()
+    
+    def _run_now_and_release(self):
+        """Run fetch_and_enroll, then allow the next run_now()."""
+        try:
+            self.fetch_and_enroll()
+        finally:
+            self._run_now_lock.release()
     
     def test_notification(self):
         """Test desktop notification functionality."""
         self._send_notification(
             "Udemy Enroller - Test",
             "This is a test notification",
-            timeout=5
+            timeout=5,
+            force=True
         )
 
 
@@ -373,13 +551,16 @@ def main():
     # Start scheduler
     scheduler.start_scheduler()
     
-    # Keep the script running
-    try:
-        while True:
-            time.sleep(1)
-    except KeyboardInterrupt:
-        logger.info("Shutting down scheduler")
-        scheduler.stop_scheduler()
+    # Keep the script running until interrupted or terminated. The wait is
+    # timed because an untimed one blocks Ctrl+C on Windows
+    stop_event = threading.Event()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: stop_event.set())
+    while not stop_event.wait(timeout=1):
+        pass
+    
+    logger.info("Shutting down scheduler")
+    scheduler.stop_scheduler()
 
 
 if __name__ == "__main__":
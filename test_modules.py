@@ -104,6 +104,49 @@ def test_filters():
         return False
 
 
+def test_filter_columns():
+    """Test that column-based filtering matches filter_courses()."""
+    print("\n=== Testing Filter Columns ===")
+    
+    import random
+    from filters import build_course_columns, filter_course_indices, filter_courses
+    
+    rng = random.Random(42)
+    words = ['Python', 'JavaScript', 'data', 'Web', 'design', 'SQL']
+    
+    def random_course():
+        course = {
+            'title': ' '.join(rng.sample(words, 2)),
+            'description': rng.choice(['', 'Learn programming', 'Intro to DATA']),
+            'rating': rng.choice([4.5, 3.9, '4.2 stars', None, 0]),
+            'duration': rng.choice([2.5, 12, '2h 30m', '8 hours', None]),
+            'language': rng.choice(['English', 'Spanish', 'english (US)'])
+        }
+        # Drop a field now and then, as scrapers do
+        course.pop(rng.choice(['rating', 'duration', 'language', 'description', 'none']), None)
+        return course
+    
+    for _ in range(300):
+        courses = [random_course() for _ in range(rng.randint(0, 12))]
+        if courses and rng.random() < 0.2:
+            courses.append({'url': 'https://example.com/no-title'})
+        
+        criteria = {
+            'min_rating': rng.choice([0.0, 4.0, 4.4]),
+            'max_duration': rng.choice([None, 3.0, 10.0]),
+            'language': rng.choice([None, 'english', 'Spanish']),
+            'keywords': rng.choice([None, 'python', ['data', 'web'], 'programming'])
+        }
+        
+        expected = filter_courses(courses, **criteria)
+        indices = filter_course_indices(build_course_columns(courses), **criteria)
+        
+        assert [courses[index] for index in indices] == expected, criteria
+    
+    print("✓ Filter columns test passed")
+    return True
+
+
 def test_enroller():
     """Test the enroller module (without actual enrollment)."""
     try:
@@ -137,6 +180,230 @@ def test_enroller():
         return False
 
 
+def test_course_url_parsing():
+    """Test course URL parsing against parse_qs-based parsing."""
+    print("\n=== Testing Course URL Parsing ===")
+    
+    from urllib.parse import parse_qs, urlsplit
+    from udemy_enroller import _parse_course_url
+    
+    urls = [
+        'https://www.udemy.com/course/python-bootcamp/?couponCode=FREE123',
+        'https://www.udemy.com/course/python-bootcamp?ref=x&couponCode=A%2BB',
+        'https://www.udemy.com/course/python-bootcamp/?couponCode=A+B',
+        'https://www.udemy.com/course/python-bootcamp/?couponCode=&couponCode=LATER',
+        'https://www.udemy.com/course/python-bootcamp/learn/?couponCode=X',
+        'https://www.udemy.com/course/python-bootcamp/',
+        'https://www.udemy.com/topic/python/?couponCode=X',
+        'https://www.udemy.com/?couponCode=X'
+    ]
+    
+    for url in urls:
+        parts = urlsplit(url).path.strip('/').split('/')
+        if len(parts) < 2 or parts[0] != 'course':
+            expected = None
+        else:
+            expected = (parts[1], parse_qs(urlsplit(url).query).get('couponCode', [None])[0])
+        
+        assert _parse_course_url(url) == expected, url
+    
+    # Malformed links are rejected instead of raising
+    from common import is_udemy_url
+    from udemy_coupon_scraper import UdemyCouponScraper
+    assert is_udemy_url('https://www.udemy.com/course/python-bootcamp/')
+    assert not is_udemy_url('https://[www.udemy.com/course/python-bootcamp/')
+    assert UdemyCouponScraper()._extract_udemy_url('https://[example.com/go?url=x') is None
+    
+    print("✓ Course URL parsing test passed")
+    return True
+
+
+class _StubResponse:
+    """Minimal stand-in for requests.Response."""
+    
+    def __init__(self, data=None, status_code=200, headers=None, url=''):
+        self.data = data
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.url = url
+    
+    def json(self):
+        return self.data
+    
+    def close(self):
+        pass
+
+
+def test_enroller_batch():
+    """Test batch verification and same-course de-duplication (no network)."""
+    print("\n=== Testing Enroller Batch ===")
+    
+    from udemy_enroller import SUBSCRIBED_COURSES_URL, CHECKOUT_URL, UdemyEnroller
+    
+    # verify_batch reads one list page per 100 courses, newest first
+    enroller = UdemyEnroller()
+    pages = []
+    
+    def list_get(url, params=None, **kwargs):
+        pages.append(params['page'])
+        ids = range((params['page'] - 1) * 100, params['page'] * 100)
+        return _StubResponse({'results': [{'id': i} for i in ids], 'next': 'more'})
+    
+    enroller.session.get = list_get
+    course_ids = [str(i) for i in range(0, 300, 2)]
+    verified = enroller.verify_batch(course_ids)
+    assert pages == [1, 2]
+    assert verified == {course_id: int(course_id) < 200 for course_id in course_ids}
+    
+    enroller.session.get = lambda url, **kwargs: _StubResponse(status_code=500)
+    assert enroller.verify_batch(['5']) == {}
+    
+    # Two coupon links for one course are checked out once
+    enroller = UdemyEnroller()
+    checkouts = []
+    
+    def get(url, params=None, **kwargs):
+        if url == CHECKOUT_URL:
+            checkouts.append(params)
+            return _StubResponse()
+        if url == SUBSCRIBED_COURSES_URL:
+            return _StubResponse({'results': [{'id': 42}], 'next': None})
+        return _StubResponse({'id': 42, 'title': 'Python Bootcamp'})
+    
+    enroller.session.get = get
+    urls = [
+        'https://www.udemy.com/course/python-bootcamp/?couponCode=FIRST',
+        'https://www.udemy.com/course/python-bootcamp/?couponCode=SECOND'
+    ]
+    updates = []
+    results = enroller.enroll_in_multiple_courses(urls, progress_callback=lambda url, result: updates.append((url, dict(result))))
+    
+    assert len(checkouts) == 1
+    assert results[urls[0]]['success'] and not results[urls[1]]['success']
+    assert 'python-bootcamp' in enroller.enrolled_courses
+    
+    # The submitted course is reported while pending, then once verified
+    first_updates = [result for url, result in updates if url == urls[0]]
+    assert [result.get('pending', False) for result in first_updates] == [True, False]
+    
+    # A course owned long ago is not on the newest list page; the
+    # per-course check still confirms it
+    enroller = UdemyEnroller()
+    
+    def owned_get(url, params=None, **kwargs):
+        if url == CHECKOUT_URL:
+            return _StubResponse()
+        if url == SUBSCRIBED_COURSES_URL:
+            return _StubResponse({'results': [{'id': 7}], 'next': 'more'})
+        if url == f"{SUBSCRIBED_COURSES_URL}42/":
+            return _StubResponse({'_class': 'course', 'id': 42})
+        return _StubResponse({'id': 42, 'title': 'Python Bootcamp'})
+    
+    enroller.session.get = owned_get
+    results = enroller.enroll_in_multiple_courses(urls[:1])
+    assert results[urls[0]]['success'], results
+    
+    print("✓ Enroller batch test passed")
+    return True
+
+
+def test_session_cookies():
+    """Test that saved session cookies are private and Udemy-only (temp dir)."""
+    print("\n=== Testing Session Cookies ===")
+    
+    import json
+    import os
+    import stat
+    import tempfile
+    import udemy_enroller
+    
+    cookies_file = udemy_enroller.SESSION_COOKIES_FILE
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        try:
+            # An older file readable by others is replaced, not reused
+            udemy_enroller.SESSION_COOKIES_FILE = os.path.join(tmp, 'cookies.json')
+            with open(udemy_enroller.SESSION_COOKIES_FILE, 'w') as f:
+                f.write('{}')
+            os.chmod(udemy_enroller.SESSION_COOKIES_FILE, 0o644)
+            
+            enroller = udemy_enroller.UdemyEnroller()
+            for domain in ('.udemy.com', 'www.udemy.com', 'notudemy.com', '.evil-udemy.com'):
+                enroller.session.cookies.set('access_token', 'x', domain=domain)
+            enroller._save_session_cookies('chrome')
+            
+            mode = stat.S_IMODE(os.stat(udemy_enroller.SESSION_COOKIES_FILE).st_mode)
+            assert mode == 0o600, oct(mode)
+            
+            with open(udemy_enroller.SESSION_COOKIES_FILE) as f:
+                saved = json.load(f)
+            assert sorted(cookie['domain'] for cookie in saved['cookies']) == ['.udemy.com', 'www.udemy.com']
+            assert os.listdir(tmp) == ['cookies.json']
+        finally:
+            udemy_enroller.SESSION_COOKIES_FILE = cookies_file
+    
+    print("✓ Session cookies test passed")
+    return True
+
+
+def test_rate_limit():
+    """Test that a persistent 429 pauses enrollments (local server, no network)."""
+    print("\n=== Testing Rate Limit ===")
+    
+    import threading
+    import time
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    import udemy_enroller
+    
+    class TooManyRequests(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(429)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+        
+        def log_message(self, *args):
+            pass
+    
+    server = HTTPServer(('127.0.0.1', 0), TooManyRequests)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    checkout_url = udemy_enroller.CHECKOUT_URL
+    
+    try:
+        enroller = udemy_enroller.UdemyEnroller(timeout=5)
+        
+        # Same retry policy as the enroller's, without the backoff sleeps
+        adapter = enroller.session.get_adapter('http://')
+        adapter.max_retries = adapter.max_retries.new(backoff_factor=0)
+        udemy_enroller.CHECKOUT_URL = f"http://127.0.0.1:{server.server_port}/course/subscribe/"
+        
+        course_info = {'course_id': '42', 'coupon_code': 'FREE', 'title': 'Python Bootcamp'}
+        success, message = enroller._attempt_enrollment(course_info)
+        
+        assert not success and '429' in message, message
+        assert enroller._rate_limit_backoff == udemy_enroller.RATE_LIMIT_BASE_DELAY
+        assert enroller._next_request_at > time.monotonic()
+        
+        # A consecutive 429 doubles the backoff
+        enroller._next_request_at = 0.0
+        enroller._attempt_enrollment(course_info)
+        assert enroller._rate_limit_backoff == 2 * udemy_enroller.RATE_LIMIT_BASE_DELAY
+        
+    finally:
+        udemy_enroller.CHECKOUT_URL = checkout_url
+        server.shutdown()
+        server.server_close()
+    
+    # Retry-After wins, and a success clears the backoff
+    enroller = udemy_enroller.UdemyEnroller()
+    enroller._note_rate_limit(_StubResponse(status_code=429, headers={'Retry-After': '7'}))
+    assert 6 < enroller._next_request_at - time.monotonic() <= 7
+    enroller._note_rate_limit(_StubResponse(headers={'X-RateLimit-Remaining': '5'}))
+    assert enroller._rate_limit_backoff == 0
+    
+    print("✓ Rate limit test passed")
+    return True
+
+
 def test_scheduler():
     """Test the scheduler module."""
     try:
@@ -208,7 +475,12 @@ def run_all_tests():
     tests = [
         test_coupon_scraper,
         test_filters,
+        test_filter_columns,
         test_enroller,
+        test_course_url_parsing,
+        test_enroller_batch,
+        test_session_cookies,
+        test_rate_limit,
         test_scheduler,
         test_gui_imports
     ]
@@ -6,6 +6,9 @@ Based on the new logo colors (purple and pink graduation theme),
 this file contains the updated color scheme for the application.
 """
 
+from functools import lru_cache
+from types import MappingProxyType
+
 # New Color Scheme based on Education Logo (Purple & Pink)
 NEW_COLORS = {
     # Primary colors from the logo
@@ -105,6 +108,10 @@ EDUCATION_THEME = {
     'section_spacing': 24
 }
 
+# Complete light and dark color schemes, built once (read-only views)
+_LIGHT_SCHEME = MappingProxyType(dict(NEW_COLORS))
+_DARK_SCHEME = MappingProxyType({**NEW_COLORS, **DARK_COLORS})
+
 def get_color_scheme(dark_mode=False):
     """
     Get the appropriate color scheme based on theme mode.
@@ -113,15 +120,9 @@ def get_color_scheme(dark_mode=False):
         dark_mode (bool): Whether to use dark mode colors
         
     Returns:
-        dict: Color scheme dictionary
+        Mapping: Read-only color scheme; use dict(...) for a mutable copy
     """
-    base_colors = NEW_COLORS.copy()
-    
-    if dark_mode:
-        # Update with dark mode specific colors
-        base_colors.update(DARK_COLORS)
-    
-    return base_colors
+    return _DARK_SCHEME if dark_mode else _LIGHT_SCHEME
 
 def apply_education_theme():
     """
@@ -133,7 +134,11 @@ def apply_education_theme():
     # Set the custom color theme
     ctk.set_appearance_mode("system")
     
-    # Create custom theme
+    return _build_education_theme()
+
+@lru_cache(maxsize=1)
+def _build_education_theme():
+    """Build the customtkinter theme dict (once; the palettes are constant)."""
     custom_theme = {
         "CTk": {
             "fg_color": [NEW_COLORS['surface'], DARK_COLORS['surface']]
@@ -10,18 +10,79 @@ Date: July 3, 2025
 """
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 import concurrent.futures
+import html
+import json
+import threading
 import time
 import logging
-from typing import List, Dict, Optional
+import os
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
 from urllib.parse import urlparse, parse_qs
 import re
 
+from common import CACHE_DIR, is_udemy_url, write_json_atomic
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Concurrent Discudemy course-link lookups shared by all listing pages
+DISCUDEMY_RESOLVE_WORKERS = 16
+
+# Keep-alive connections per host; enough for all page and resolve workers
+HTTP_POOL_SIZE = 32
+
+# (connect, read) timeouts for page requests; dead hosts fail fast and
+# transient errors are retried by the session adapter instead
+REQUEST_TIMEOUT = (5, 10)
+REQUEST_RETRY = Retry(
+    total=3,
+    connect=2,
+    read=2,
+    backoff_factor=0.3,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods={'GET'}
+)
+
+# Query parameters affiliate/redirect links use to carry the target URL
+REDIRECT_TARGET_PARAMS = ('murl', 'url', 'u', 'target', 'redirect', 'goto')
+
+# Real Discount API endpoint, query and the headers it needs on top of the
+# session defaults
+REAL_DISCOUNT_API_URL = "https://cdn.real.discount/api/courses"
+REAL_DISCOUNT_PARAMS = {
+    'page': 1,
+    'limit': 500,
+    'sortBy': 'sale_start',
+    'store': 'Udemy',
+    'freeOnly': 'true'
+}
+REAL_DISCOUNT_HEADERS = {
+    'Host': 'cdn.real.discount',
+    'Referer': 'https://www.real.discount/',
+    'Accept': 'application/json, text/plain, */*'
+}
+
+# Resolved Discudemy links are kept on disk between runs for this long (seconds)
+DISCUDEMY_CACHE_FILE = os.path.join(CACHE_DIR, "discudemy_links.json")
+DISCUDEMY_CACHE_TTL = 24 * 60 * 60
+
+# Only the parts of Discudemy pages the scraper reads are parsed
+DISCUDEMY_CARDS = SoupStrainer('a', {'class': 'card-header'})
+DISCUDEMY_SEGMENT = SoupStrainer('div', {'class': 'ui segment'})
+
+# First link inside the 'ui segment' div of a Discudemy link page, matched on
+# the raw HTML before falling back to a parse
+DISCUDEMY_LINK_PATTERN = re.compile(
+    rb'<div class="ui segment">(?:(?!</div>).)*?<a\s[^>]*?\bhref="([^"]+)"',
+    re.DOTALL
+)
+
 
 class UdemyCouponScraper:
     """
@@ -34,7 +95,8 @@ class UdemyCouponScraper:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
+            # Only what urllib3 can decode here: br and zstd need brotli and zstandard
+            'Accept-Encoding': ACCEPT_ENCODING,
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
             'Sec-Fetch-Dest': 'document',
@@ -47,21 +109,51 @@ class UdemyCouponScraper:
         self.session = requests.Session()
         self.session.headers.update(self.headers)
         
-    def _make_request(self, url: str, timeout: int = 30) -> Optional[requests.Response]:
+        # Size the connection pool for the worker threads sharing this session
+        # and retry transient failures with backoff
+        adapter = HTTPAdapter(pool_maxsize=HTTP_POOL_SIZE, max_retries=REQUEST_RETRY)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        
+        # Scrape functions for every supported source; each returns a list
+        # of course dictionaries and can be run concurrently with the others
+        self.sources = [self.scrape_real_discount, self.scrape_discudemy]
+        
+        # Set by stop(); pending requests are then skipped
+        self._stop_event = threading.Event()
+        
+        # Resolved Udemy URLs and when they were resolved, by Discudemy
+        # course ID (successful lookups only)
+        self._discudemy_urls = self._load_discudemy_cache()
+        
+    def stop(self):
+        """
+        Stop scraping: requests not yet sent are skipped, so running scrapes
+        finish after their current request. Used when the app is closing.
+        """
+        self._stop_event.set()
+    
+    def _make_request(self, url: str, timeout: Union[float, Tuple[float, float]] = REQUEST_TIMEOUT) -> Optional[requests.Response]:
         """
         Make a safe HTTP request with error handling.
         
         Args:
             url (str): The URL to request
-            timeout (int): Request timeout in seconds
+            timeout (float|Tuple[float, float]): Request timeout in seconds,
+                or (connect, read) timeouts
             
         Returns:
             Optional[requests.Response]: Response object or None if failed
         """
+        if self._stop_event.is_set():
+            return None
+        
         try:
             response = self.session.get(url, timeout=timeout)
-            response.raise_for_status()
-            return response
+            if response.ok:
+                return response
+            logger.error(f"Request failed for {url}: HTTP {response.status_code}")
+            return None
         except requests.exceptions.RequestException as e:
             logger.error(f"Request failed for {url}: {e}")
             return None
@@ -70,28 +162,37 @@ class UdemyCouponScraper:
         """
         Extract and validate Udemy URL from a redirect or affiliate link.
         
+        A Udemy URL carried in the link's query string is used directly.
+        Other redirect links are not followed here: that would cost one
+        request per scraped course. They are kept as-is and resolved by the
+        enroller only for courses that are actually enrolled in.
+        
         Args:
             url (str): The URL to extract from
             
         Returns:
-            Optional[str]: Clean Udemy URL or None if invalid
+            Optional[str]: Udemy or redirect URL, or None if invalid
         """
         try:
-            # If it's already a udemy.com URL, return it
-            if 'udemy.com' in url:
-                return url
-            
-            # Follow redirects to get the final URL
-            response = self._make_request(url)
-            if response:
-                final_url = response.url
-                if 'udemy.com' in final_url:
-                    return final_url
-                    
-        except Exception as e:
-            logger.error(f"Failed to extract Udemy URL from {url}: {e}")
+            parsed = urlparse(url)
+        except ValueError:
+            # Malformed URL, e.g. an unclosed "[" in the host
+            return None
+        if parsed.scheme not in ('http', 'https') or not parsed.netloc:
+            return None
+        
+        # If it's already a udemy.com URL, return it
+        if is_udemy_url(url):
+            return url
+        
+        # parse_qs percent-decodes the embedded target URL
+        query_params = parse_qs(parsed.query)
+        for key in REDIRECT_TARGET_PARAMS:
+            for target in query_params.get(key, ()):
+                if is_udemy_url(target):
+                    return target
             
-        return None
+        return url
     
     def scrape_real_discount(self) -> List[Dict[str, str]]:
         """
@@ -103,26 +204,14 @@ class UdemyCouponScraper:
         courses = []
         
         try:
-            # Real Discount API endpoint
-            api_url = "https://cdn.real.discount/api/courses"
-            params = {
-                'page': 1,
-                'limit': 500,
-                'sortBy': 'sale_start',
-                'store': 'Udemy',
-                'freeOnly': 'true'
-            }
-            
-            # Custom headers for Real Discount API
-            api_headers = self.headers.copy()
-            api_headers.update({
-                'Host': 'cdn.real.discount',
-                'Referer': 'https://www.real.discount/',
-                'Accept': 'application/json, text/plain, */*'
-            })
-            
             logger.info("Fetching courses from Real Discount...")
-            response = requests.get(api_url, params=params, headers=api_headers, timeout=30)
+            # Session headers are merged with the API-specific ones
+            response = self.session.get(
+                REAL_DISCOUNT_API_URL,
+                params=REAL_DISCOUNT_PARAMS,
+                headers=REAL_DISCOUNT_HEADERS,
+                timeout=30
+            )
             response.raise_for_status()
             
             data = response.json()
@@ -130,6 +219,9 @@ class UdemyCouponScraper:
             
             logger.info(f"Found {len(items)} courses from Real Discount")
             
+            append = courses.append
+            extract_udemy_url = self._extract_udemy_url
+            
             for item in items:
                 if item.get('store') == 'Sponsored':
                     continue
@@ -139,9 +231,9 @@ class UdemyCouponScraper:
                 
                 if title and url:
                     # Extract clean Udemy URL
-                    udemy_url = self._extract_udemy_url(url)
+                    udemy_url = extract_udemy_url(url)
                     if udemy_url:
-                        courses.append({
+                        append({
                             'title': title,
                             'url': udemy_url,
                             'source': 'real.discount'
@@ -164,11 +256,14 @@ class UdemyCouponScraper:
         try:
             logger.info("Fetching courses from Discudemy...")
             
-            # Scrape multiple pages concurrently
-            with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
+            # Scrape multiple pages concurrently; course links found on them
+            # are resolved on a separate pool so page workers never wait on
+            # tasks queued behind themselves
+            with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor, \
+                    concurrent.futures.ThreadPoolExecutor(max_workers=DISCUDEMY_RESOLVE_WORKERS) as resolver:
                 # Submit page scraping tasks
                 future_to_page = {
-                    executor.submit(self._scrape_discudemy_page, page): page 
+                    executor.submit(self._scrape_discudemy_page, page, resolver): page 
                     for page in range(1, 6)  # Scrape first 5 pages
                 }
                 
@@ -183,15 +278,58 @@ class UdemyCouponScraper:
                         
         except Exception as e:
             logger.error(f"Error scraping Discudemy: {e}")
+        
+        self._save_discudemy_cache()
             
         return courses
     
-    def _scrape_discudemy_page(self, page: int) -> List[Dict[str, str]]:
+    def _load_discudemy_cache(self) -> Dict[str, Tuple[str, float]]:
+        """
+        Load resolved Discudemy links saved by an earlier run.
+        
+        Returns:
+            Dict[str, Tuple[str, float]]: (Udemy URL, resolve time) by course ID;
+                empty if there is no usable cache file
+        """
+        now = time.time()
+        
+        try:
+            with open(DISCUDEMY_CACHE_FILE, encoding='utf-8') as f:
+                entries = json.load(f)
+            
+            return {
+                course_id: (url, resolved_at)
+                for course_id, (url, resolved_at) in entries.items()
+                if now - resolved_at < DISCUDEMY_CACHE_TTL
+            }
+            
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            logger.warning(f"Ignoring Discudemy link cache: {e}")
+            return {}
+    
+    def _save_discudemy_cache(self):
+        """Save resolved Discudemy links that have not expired yet."""
+        now = time.time()
+        entries = {
+            course_id: entry for course_id, entry in self._discudemy_urls.items()
+            if now - entry[1] < DISCUDEMY_CACHE_TTL
+        }
+        
+        try:
+            write_json_atomic(DISCUDEMY_CACHE_FILE, entries)
+        except OSError as e:
+            logger.warning(f"Could not save Discudemy link cache: {e}")
+    
+    def _scrape_discudemy_page(self, page: int, executor: Optional[concurrent.futures.Executor] = None) -> List[Dict[str, str]]:
         """
         Scrape a single page from Discudemy.
         
         Args:
             page (int): Page number to scrape
+            executor (Executor, optional): Resolve the page's course links
+                concurrently on this executor; one at a time when omitted
             
         Returns:
             List[Dict[str, str]]: List of course dictionaries from this page
@@ -205,12 +343,19 @@ class UdemyCouponScraper:
             if not response:
                 return courses
                 
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml', parse_only=DISCUDEMY_CARDS)
             
             # Find all course cards
             course_cards = soup.find_all('a', {'class': 'card-header'})
             
-            # Process each course card
+            # Collect title and course ID from each course card
+            titles = []
+            course_ids = []
+            add_title = titles.append
+            add_course_id = course_ids.append
+            card_errors = 0
+            last_error = None
+            
             for card in course_cards:
                 try:
                     title = card.get_text(strip=True)
@@ -218,21 +363,30 @@ class UdemyCouponScraper:
                     
                     if title and href:
                         # Extract course ID from href
-                        course_id = href.split('/')[-1]
-                        
-                        # Get the actual Udemy URL
-                        udemy_url = self._get_discudemy_course_url(course_id)
-                        
-                        if udemy_url:
-                            courses.append({
-                                'title': title,
-                                'url': udemy_url,
-                                'source': 'discudemy.com'
-                            })
+                        add_title(title)
+                        add_course_id(href.rpartition('/')[2])
                             
                 except Exception as e:
-                    logger.error(f"Error processing Discudemy course card: {e}")
-                    continue
+                    # Reported once per page below, not once per card
+                    card_errors += 1
+                    last_error = e
+            
+            if card_errors:
+                logger.error(
+                    f"Error processing {card_errors} Discudemy course cards on page {page}: {last_error}"
+                )
+            
+            # Get the actual Udemy URLs
+            resolve = executor.map if executor else map
+            udemy_urls = resolve(self._get_discudemy_course_url, course_ids)
+            
+            for title, udemy_url in zip(titles, udemy_urls):
+                if udemy_url:
+                    courses.append({
+                        'title': title,
+                        'url': udemy_url,
+                        'source': 'discudemy.com'
+                    })
                     
         except Exception as e:
             logger.error(f"Error scraping Discudemy page {page}: {e}")
@@ -249,25 +403,35 @@ class UdemyCouponScraper:
         Returns:
             Optional[str]: The Udemy URL or None if not found
         """
+        cached = self._discudemy_urls.get(course_id)
+        if cached and time.time() - cached[1] < DISCUDEMY_CACHE_TTL:
+            return cached[0]
+        
         try:
             url = f"https://www.discudemy.com/go/{course_id}"
             response = self._make_request(url)
             
             if not response:
                 return None
+            
+            match = DISCUDEMY_LINK_PATTERN.search(response.content)
+            if match:
+                udemy_url = html.unescape(match.group(1).decode('utf-8', 'replace'))
+            else:
+                udemy_url = None
+                soup = BeautifulSoup(response.content, 'lxml', parse_only=DISCUDEMY_SEGMENT)
                 
-            soup = BeautifulSoup(response.content, 'html.parser')
+                # Find the segment with the Udemy link
+                segment = soup.find('div', {'class': 'ui segment'})
+                if segment:
+                    link = segment.find('a')
+                    if link:
+                        udemy_url = link.get('href')
             
-            # Find the segment with the Udemy link
-            segment = soup.find('div', {'class': 'ui segment'})
-            if segment:
-                link = segment.find('a')
-                if link and link.get('href'):
-                    udemy_url = link.get('href')
-                    
-                    # Validate it's a Udemy URL
-                    if 'udemy.com' in udemy_url:
-                        return udemy_url
+            # Validate it's a Udemy URL
+            if udemy_url and is_udemy_url(udemy_url):
+                self._discudemy_urls[course_id] = (udemy_url, time.time())
+                return udemy_url
                         
         except Exception as e:
             logger.error(f"Error getting Discudemy course URL for {course_id}: {e}")
@@ -281,28 +445,108 @@ class UdemyCouponScraper:
         Returns:
             List[Dict[str, str]]: List of all course dictionaries
         """
-        all_courses = []
-        
         # Scrape from all sources
-        real_discount_courses = self.scrape_real_discount()
-        discudemy_courses = self.scrape_discudemy()
+        course_lists = [scrape() for scrape in self.sources]
         
-        # Combine all courses
-        all_courses.extend(real_discount_courses)
-        all_courses.extend(discudemy_courses)
+        return self.merge_courses(course_lists)
+    
+    def iter_courses(
+        self,
+        executor: Optional[concurrent.futures.Executor] = None,
+        timeout: Optional[float] = None
+    ) -> Iterator[List[Dict[str, str]]]:
+        """
+        Yield each source's courses as soon as that source has been scraped.
         
-        # Remove duplicates based on URL
+        Args:
+            executor (Executor, optional): Run all sources concurrently on this
+                executor and yield in completion order; sources run one after
+                another when omitted
+            timeout (float, optional): Seconds to wait for all sources when
+                using an executor; sources still running then are given up on
+                (they finish in the background) and iteration stops
+        
+        Yields:
+            List[Dict[str, str]]: Courses from one source whose URLs were not
+                already yielded for an earlier source
+        """
         seen_urls = set()
-        unique_courses = []
         
-        for course in all_courses:
-            if course['url'] not in seen_urls:
-                seen_urls.add(course['url'])
-                unique_courses.append(course)
+        if executor is None:
+            results = (scrape() for scrape in self.sources)
+        else:
+            futures = {executor.submit(scrape): scrape for scrape in self.sources}
+            results = self._completed_results(futures, timeout)
+        
+        for courses in results:
+            yield self._new_courses(courses, seen_urls)
+    
+    def _completed_results(self, futures: Dict[concurrent.futures.Future, Callable], timeout: Optional[float]) -> Iterator[List[Dict[str, str]]]:
+        """
+        Yield source results in completion order until all are done or the timeout passes.
+        
+        Args:
+            futures (Dict[Future, Callable]): Scrape function by its future
+            timeout (float, optional): Seconds to wait for all futures
+        
+        Yields:
+            List[Dict[str, str]]: Courses from one source
+        """
+        try:
+            for future in concurrent.futures.as_completed(futures, timeout=timeout):
+                try:
+                    courses = future.result()
+                except Exception as e:
+                    # A failing source only loses its own courses
+                    logger.error(f"Error fetching courses from {futures[future].__name__}: {e}")
+                    continue
+                yield courses
+        except concurrent.futures.TimeoutError:
+            for future, scrape in futures.items():
+                if not future.done():
+                    logger.warning(f"Timed out fetching courses from {scrape.__name__}")
+    
+    def merge_courses(self, course_lists: List[List[Dict[str, str]]]) -> List[Dict[str, str]]:
+        """
+        Combine per-source course lists, dropping duplicate URLs.
+        
+        Args:
+            course_lists (List[List[Dict[str, str]]]): Course lists in source order
+        
+        Returns:
+            List[Dict[str, str]]: Unique courses, first occurrence wins
+        """
+        # Dicts keep insertion order, so the first course per URL stays first
+        unique_courses = {}
+        
+        for courses in course_lists:
+            for course in courses:
+                unique_courses.setdefault(course['url'], course)
                 
         logger.info(f"Total unique courses found: {len(unique_courses)}")
         
-        return unique_courses
+        return list(unique_courses.values())
+    
+    def _new_courses(self, courses: List[Dict[str, str]], seen_urls: set) -> List[Dict[str, str]]:
+        """
+        Filter out courses whose URL is in seen_urls, recording the rest.
+        
+        Args:
+            courses (List[Dict[str, str]]): Courses to check
+            seen_urls (set): URLs already taken; updated in place
+        
+        Returns:
+            List[Dict[str, str]]: Courses with URLs not seen before
+        """
+        new_courses = []
+        
+        # Remove duplicates based on URL
+        for course in courses:
+            if course['url'] not in seen_urls:
+                seen_urls.add(course['url'])
+                new_courses.append(course)
+        
+        return new_courses
 
 
 def main():
@@ -7,18 +7,26 @@ It can automatically enroll users in courses using coupons and handles various
 enrollment scenarios and errors.
 """
 
+import html
 import json
 import logging
+import os
+import random
 import re
+import threading
 import time
-from typing import Dict, List, Optional, Tuple
-from urllib.parse import parse_qs, urlparse
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import unquote_plus, urlsplit
 
-import browser_cookie3
 import requests
 from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
 from urllib3.util.retry import Retry
 
+from common import CACHE_DIR, is_udemy_url, write_json_atomic
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -26,6 +34,89 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Enrollment requests are only paused when Udemy's rate-limit headers ask
+# for it. Without a Retry-After, the pause starts at RATE_LIMIT_BASE_DELAY
+# seconds and its jittered upper bound doubles on each consecutive 429
+RATE_LIMIT_BASE_DELAY = 2
+RATE_LIMIT_MAX_DELAY = 60
+
+# Page size and parallel page fetches when loading enrolled courses
+ENROLLED_PAGE_SIZE = 100
+ENROLLED_PAGE_WORKERS = 4
+
+# Enrolled-course slugs with the ETag they were loaded under; revalidated with
+# If-None-Match so an unchanged list costs a single request. The ETag belongs
+# to the list's contents, so a 304 is valid whichever account is logged in
+ENROLLED_CACHE_FILE = os.path.join(CACHE_DIR, "enrolled_courses.json")
+
+# Keep-alive connections per host, enough for concurrent enrollment and
+# page-loading workers sharing the session
+HTTP_POOL_SIZE = 16
+
+# Course slug in a course URL, and course ID / title on a course page.
+# The course page's <body> carries the ID as data-clp-course-id; the first
+# "id" in embedded JSON is only a fallback, as it may belong to something else
+_SLUG_PATTERN = re.compile(r'/course/([^/]+)/')
+_COURSE_PATH_PATTERN = re.compile(r'/course/([^/]+)')
+_CLP_COURSE_ID_PATTERN = re.compile(rb'data-clp-course-id="(\d+)"')
+_COURSE_ID_PATTERN = re.compile(rb'"id":(\d+)')
+_TITLE_PATTERN = re.compile(rb'<title>(.+?)</title>')
+
+# Course API returning just the ID and title for a course slug
+COURSE_API_URL = "https://www.udemy.com/api-2.0/courses/{slug}/"
+COURSE_API_PARAMS = {'fields[course]': 'id,title'}
+
+# Seconds a looked-up course ID and title are reused for the same slug
+COURSE_DETAILS_CACHE_TTL = 3600
+
+# Course pages are read in chunks of this size until ID and title are found
+PAGE_CHUNK_SIZE = 64 * 1024
+
+# Bytes of already-searched page re-searched with each new chunk, so a match
+# split across two chunks is still found
+PAGE_SEARCH_OVERLAP = 1024
+
+# Subscribed-courses list used to verify a whole batch of enrollments at once
+SUBSCRIBED_COURSES_URL = 'https://www.udemy.com/api-2.0/users/me/subscribed-courses/'
+
+# Udemy cookies of a validated browser session, reused by later runs for up
+# to SESSION_COOKIES_MAX_AGE seconds instead of decrypting the browser's
+# cookie store again. They are credentials, so the file is readable only by
+# the user
+SESSION_COOKIES_FILE = os.path.join(CACHE_DIR, "cookies.json")
+SESSION_COOKIES_MAX_AGE = 8 * 3600
+
+# Checkout endpoint that enrolls in a free (couponed) course
+CHECKOUT_URL = 'https://www.udemy.com/course/subscribe/'
+
+
+@lru_cache(maxsize=4096)
+def _parse_course_url(course_url: str) -> Optional[Tuple[str, Optional[str]]]:
+    """
+    Split a course URL into its slug and coupon code.
+    
+    Args:
+        course_url (str): Udemy course URL
+        
+    Returns:
+        tuple: (slug, coupon_code or None), or None if it is not a course URL
+    """
+    parsed_url = urlsplit(course_url)
+    
+    # Extract course slug from URL path
+    slug_match = _COURSE_PATH_PATTERN.match(parsed_url.path)
+    if not slug_match:
+        return None
+    
+    # Extract coupon code from query parameters; only couponCode is
+    # needed, so the rest of the query is not parsed
+    for param in parsed_url.query.split('&'):
+        name, _, value = param.partition('=')
+        if name == 'couponCode' and value:
+            return slug_match.group(1), unquote_plus(value)
+    
+    return slug_match.group(1), None
+
 
 class UdemyEnroller:
     """
@@ -51,6 +142,29 @@ class UdemyEnroller:
         self.user_info = None
         self.enrolled_courses = set()
         
+        # (browser_id, cookie jar) of the last browser cookie load, and
+        # whether that jar came from SESSION_COOKIES_FILE
+        self._raw_jar = None
+        self._cookies_from_disk = False
+        
+        # Earliest time (monotonic) the next enrollment request may be sent,
+        # shared by all enrollment workers
+        self._rate_limit_lock = threading.Lock()
+        self._next_request_at = 0.0
+        self._rate_limit_backoff = 0
+        
+        # Set by stop(); enrollments not yet started are then skipped
+        self._stop_event = threading.Event()
+        
+        # Slugs with an enrollment in progress (submitted but not yet
+        # verified), so a second link to the same course is not checked out
+        self._enrolling_lock = threading.Lock()
+        self._enrolling_slugs = set()
+        
+        # Course ID and title by slug, as (time, course_id, title)
+        self._course_details_lock = threading.Lock()
+        self._course_details = {}
+        
         # Setup session with retry strategy
         self._setup_session()
     
@@ -58,13 +172,15 @@ class UdemyEnroller:
         """Setup requests session with retry strategy and realistic headers."""
         self.session = requests.Session()
         
-        # Setup retry strategy
+        # Setup retry strategy; once retries run out the last response is
+        # returned rather than raised, so a 429 still reaches the rate limiter
         retry_strategy = Retry(
             total=3,
             backoff_factor=1,
             status_forcelist=[429, 500, 502, 503, 504],
+            raise_on_status=False,
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(pool_maxsize=HTTP_POOL_SIZE, max_retries=retry_strategy)
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
         
@@ -73,7 +189,8 @@ class UdemyEnroller:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate, br',
+            # Only what urllib3 can decode here: br and zstd need brotli and zstandard
+            'Accept-Encoding': ACCEPT_ENCODING,
             'DNT': '1',
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
@@ -104,39 +221,31 @@ class UdemyEnroller:
             bool: True if cookies loaded successfully, False otherwise
         """
         try:
-            from browser_manager import BrowserManager
+            # Reading a browser's cookie store means copying and decrypting
+            # it, so a repeat load from the same browser reuses the jar
+            if self._raw_jar and self._raw_jar[0] == browser_id:
+                raw_cookies = self._raw_jar[1]
+            else:
+                raw_cookies = self._load_saved_cookies(browser_id)
+                self._cookies_from_disk = raw_cookies is not None
+                
+                if raw_cookies is None:
+                    from browser_manager import BrowserManager
+                    
+                    browser_manager = BrowserManager()
+                    success, _, error_message = browser_manager.load_cookies_from_browser(browser_id)
+                    
+                    if not success:
+                        logger.error(f"Failed to load cookies from {browser_id}: {error_message}")
+                        return False
+                    
+                    raw_cookies = browser_manager.last_cookie_jar
+                
+                self._raw_jar = (browser_id, raw_cookies)
             
-            browser_manager = BrowserManager()
-            success, cookie_dict, error_message = browser_manager.load_cookies_from_browser(browser_id)
-            
-            if not success:
-                logger.error(f"Failed to load cookies from {browser_id}: {error_message}")
-                return False
+            cookie_dict = {cookie.name: cookie.value for cookie in raw_cookies}
             
             # Update session with cookies
-            # Convert cookie_dict back to browser_cookie3 format for session
-            from browser_manager import BrowserManager
-            browser_manager = BrowserManager()
-            
-            # Get raw cookies for session
-            if browser_id == 'chrome':
-                raw_cookies = browser_cookie3.chrome(domain_name='udemy.com')
-            elif browser_id == 'firefox':
-                raw_cookies = browser_cookie3.firefox(domain_name='udemy.com')
-            elif browser_id == 'edge':
-                raw_cookies = browser_cookie3.edge(domain_name='udemy.com')
-            elif browser_id == 'safari':
-                raw_cookies = browser_cookie3.safari(domain_name='udemy.com')
-            elif browser_id == 'brave':
-                raw_cookies = browser_cookie3.brave(domain_name='udemy.com')
-            elif browser_id == 'opera':
-                raw_cookies = browser_cookie3.opera(domain_name='udemy.com')
-            elif browser_id == 'opera_gx':
-                raw_cookies = browser_cookie3.opera_gx(domain_name='udemy.com')
-            else:
-                logger.error(f"Unsupported browser: {browser_id}")
-                return False
-            
             self.session.cookies.update(raw_cookies)
             self.cookies = cookie_dict
             
@@ -147,39 +256,138 @@ class UdemyEnroller:
             logger.error(f"Error loading cookies from {browser_id}: {e}")
             return False
     
-    def validate_authentication(self) -> bool:
+    def _load_saved_cookies(self, browser_id: str) -> Optional[requests.cookies.RequestsCookieJar]:
         """
-        Validate user authentication by checking Udemy API.
+        Load the cookies saved from a validated session of this browser.
         
+        Args:
+            browser_id: Browser identifier the cookies must come from
+            
         Returns:
-            bool: True if authenticated, False otherwise
+            RequestsCookieJar: Saved cookies, or None if there are none or
+                they are too old
         """
         try:
-            logger.info("Validating authentication...")
+            if time.time() - os.path.getmtime(SESSION_COOKIES_FILE) >= SESSION_COOKIES_MAX_AGE:
+                return None
             
-            # Check authentication status
-            response = self.session.get(
-                'https://www.udemy.com/api-2.0/contexts/me/?header=True',
-                timeout=self.timeout
-            )
+            with open(SESSION_COOKIES_FILE, encoding='utf-8') as f:
+                saved = json.load(f)
             
-            if response.status_code != 200:
-                logger.error(f"Authentication check failed: {response.status_code}")
-                return False
+            if saved.get('browser_id') != browser_id or not saved.get('cookies'):
+                return None
             
-            data = response.json()
+            jar = requests.cookies.RequestsCookieJar()
+            for cookie in saved['cookies']:
+                jar.set_cookie(requests.cookies.create_cookie(**cookie))
             
-            # Check if user is logged in
-            if not data.get('header', {}).get('isLoggedIn', False):
-                logger.error("User is not logged in")
-                return False
+            logger.info(f"Using saved session cookies for {browser_id}")
+            return jar
             
-            # Store user information
-            self.user_info = data.get('header', {}).get('user', {})
-            logger.info(f"Authenticated as: {self.user_info.get('display_name', 'Unknown')}")
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            logger.warning(f"Ignoring saved session cookies: {e}")
+        
+        return None
+    
+    def _save_session_cookies(self, browser_id: str):
+        """Save the session's Udemy cookies for later runs."""
+        cookies = [
+            {
+                'name': cookie.name,
+                'value': cookie.value,
+                'domain': cookie.domain,
+                'path': cookie.path,
+                'secure': cookie.secure,
+                'expires': cookie.expires
+            }
+            for cookie in self.session.cookies
+            if cookie.domain.lstrip('.') == 'udemy.com' or cookie.domain.endswith('.udemy.com')
+        ]
+        
+        try:
+            # Written owner-only (see write_json_atomic), also over an older
+            # file that was readable by others
+            write_json_atomic(SESSION_COOKIES_FILE, {'browser_id': browser_id, 'cookies': cookies})
+        except OSError as e:
+            logger.warning(f"Could not save session cookies: {e}")
+    
+    def _remove_saved_cookies(self):
+        """Delete saved session cookies that Udemy no longer accepts."""
+        try:
+            os.remove(SESSION_COOKIES_FILE)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Could not remove saved session cookies: {e}")
+    
+    def validate_authentication(self) -> bool:
+        """
+        Validate user authentication by checking Udemy API.
+        
+        Browser cookies that pass are saved for later runs. If saved cookies
+        fail, they are discarded and the browser is read again.
+        
+        Returns:
+            bool: True if authenticated, False otherwise
+        """
+        if self._check_authentication():
+            if self._raw_jar and not self._cookies_from_disk:
+                self._save_session_cookies(self._raw_jar[0])
+                self._cookies_from_disk = True
+            return True
+        
+        if not (self._raw_jar and self._cookies_from_disk):
+            return False
+        
+        logger.info("Saved session cookies were rejected, reading the browser again")
+        browser_id = self._raw_jar[0]
+        self._remove_saved_cookies()
+        self._raw_jar = None
+        self.session.cookies.clear()
+        
+        # Still from disk means the saved file could not be removed
+        if not self.load_cookies_from_browser(browser_id) or self._cookies_from_disk:
+            return False
+        
+        return self.validate_authentication()
+    
+    def _check_authentication(self) -> bool:
+        """
+        Check the session against Udemy's API and load enrolled courses.
+        
+        Returns:
+            bool: True if authenticated, False otherwise
+        """
+        try:
+            logger.info("Validating authentication...")
             
-            # Load enrolled courses
-            self._load_enrolled_courses()
+            # The enrolled courses only need the session cookies, so they load
+            # while the login is checked; leaving the block waits for them
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="enrolled") as executor:
+                executor.submit(self._load_enrolled_courses)
+                
+                # Check authentication status
+                response = self.session.get(
+                    'https://www.udemy.com/api-2.0/contexts/me/?header=True',
+                    timeout=self.timeout
+                )
+                
+                if response.status_code != 200:
+                    logger.error(f"Authentication check failed: {response.status_code}")
+                    return False
+                
+                data = response.json()
+                
+                # Check if user is logged in
+                if not data.get('header', {}).get('isLoggedIn', False):
+                    logger.error("User is not logged in")
+                    return False
+                
+                # Store user information
+                self.user_info = data.get('header', {}).get('user', {})
+                logger.info(f"Authenticated as: {self.user_info.get('display_name', 'Unknown')}")
             
             return True
             
@@ -193,44 +401,125 @@ class UdemyEnroller:
             logger.info("Loading enrolled courses...")
             
             # Get enrolled courses from Udemy API
-            url = 'https://www.udemy.com/api-2.0/users/me/subscribed-courses/'
+            url = SUBSCRIBED_COURSES_URL
             params = {
                 'ordering': '-enroll_time',
                 'fields[course]': 'enrollment_time,url',
-                'page_size': 100
+                'page_size': ENROLLED_PAGE_SIZE
             }
             
-            enrolled_courses = set()
-            
-            while url:
-                response = self.session.get(url, params=params, timeout=self.timeout)
+            def fetch_page(page, headers=None):
+                response = self.session.get(
+                    url,
+                    params={**params, 'page': page},
+                    headers=headers,
+                    timeout=self.timeout
+                )
                 
-                if response.status_code != 200:
-                    logger.warning(f"Failed to load enrolled courses: {response.status_code}")
-                    break
-                
-                data = response.json()
+                if response.status_code not in (200, 304):
+                    logger.warning(f"Failed to load enrolled courses page {page}: {response.status_code}")
                 
+                return response
+            
+            cache = self._read_enrolled_cache()
+            
+            response = fetch_page(1, {'If-None-Match': cache['etag']} if cache else None)
+            if response.status_code == 304:
+                self.enrolled_courses = set(cache['slugs'])
+                logger.info(f"Enrolled courses unchanged, loaded {len(self.enrolled_courses)} from cache")
+                return
+            
+            def page_data(response):
+                return response.json() if response.status_code == 200 else {}
+            
+            # The first page gives the total, so the rest can be fetched concurrently
+            pages = [page_data(response)]
+            page_count = -(-pages[0].get('count', 0) // ENROLLED_PAGE_SIZE)
+            
+            if page_count > 1:
+                workers = min(ENROLLED_PAGE_WORKERS, page_count - 1)
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="enrolled") as executor:
+                    pages.extend(map(page_data, executor.map(fetch_page, range(2, page_count + 1))))
+            
+            enrolled_courses = set()
+            
+            for data in pages:
                 # Extract course slugs from URLs
                 for course in data.get('results', []):
                     course_url = course.get('url', '')
                     if course_url:
                         # Extract slug from URL like /course/python-bootcamp/
-                        slug_match = re.search(r'/course/([^/]+)/', course_url)
+                        slug_match = _SLUG_PATTERN.search(course_url)
                         if slug_match:
                             enrolled_courses.add(slug_match.group(1))
-                
-                # Check for next page
-                url = data.get('next')
-                params = None  # Only use params for first request
             
             self.enrolled_courses = enrolled_courses
             logger.info(f"Loaded {len(enrolled_courses)} enrolled courses")
             
+            # Only a complete list may be reused later
+            etag = response.headers.get('ETag')
+            if etag and all(pages):
+                self._write_enrolled_cache(etag, enrolled_courses)
+            
         except Exception as e:
             logger.error(f"Error loading enrolled courses: {e}")
             self.enrolled_courses = set()
     
+    def _read_enrolled_cache(self) -> Optional[Dict]:
+        """
+        Read the cached enrolled-course list.
+        
+        Returns:
+            dict: 'etag' and 'slugs', or None if there is no usable cache
+        """
+        try:
+            with open(ENROLLED_CACHE_FILE, encoding='utf-8') as f:
+                cache = json.load(f)
+            
+            if cache.get('etag') and isinstance(cache.get('slugs'), list):
+                return cache
+            
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"Ignoring enrolled courses cache: {e}")
+        
+        return None
+    
+    def _write_enrolled_cache(self, etag: str, slugs: set):
+        """Save the enrolled-course slugs with the list's ETag."""
+        try:
+            write_json_atomic(ENROLLED_CACHE_FILE, {'etag': etag, 'slugs': sorted(slugs)})
+        except OSError as e:
+            logger.warning(f"Could not save enrolled courses cache: {e}")
+    
+    def _resolve_course_url(self, course_url: str) -> str:
+        """
+        Follow redirect/affiliate links to the Udemy course URL.
+        
+        Scrapers pass such links through unresolved, so the redirect is only
+        followed for courses that are actually enrolled in.
+        
+        Args:
+            course_url (str): Udemy course URL or a link redirecting to one
+            
+        Returns:
+            str: The final URL, or course_url unchanged if it is already a
+                Udemy URL or the request fails
+        """
+        if is_udemy_url(course_url):
+            return course_url
+        
+        try:
+            # Only the final URL is needed, so don't download the body
+            response = self.session.get(course_url, timeout=self.timeout, stream=True)
+            response.close()
+            return response.url
+            
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Failed to resolve course URL {course_url}: {e}")
+            return course_url
+    
     def _extract_course_info(self, course_url: str) -> Optional[Dict]:
         """
         Extract course information from Udemy course URL.
@@ -242,19 +531,12 @@ class UdemyEnroller:
             dict: Course information including slug, coupon code, and course ID
         """
         try:
-            parsed_url = urlparse(course_url)
-            
-            # Extract course slug from URL path
-            path_parts = parsed_url.path.strip('/').split('/')
-            if len(path_parts) < 2 or path_parts[0] != 'course':
+            parsed = _parse_course_url(course_url)
+            if not parsed:
                 logger.error(f"Invalid course URL format: {course_url}")
                 return None
             
-            slug = path_parts[1]
-            
-            # Extract coupon code from query parameters
-            query_params = parse_qs(parsed_url.query)
-            coupon_code = query_params.get('couponCode', [None])[0]
+            slug, coupon_code = parsed
             
             if not coupon_code:
                 logger.error(f"No coupon code found in URL: {course_url}")
@@ -274,6 +556,42 @@ class UdemyEnroller:
         """
         Get detailed course information from Udemy API.
         
+        Args:
+            course_info (dict): Basic course information
+            
+        Returns:
+            dict: Detailed course information
+        """
+        slug = course_info['slug']
+        now = time.monotonic()
+        
+        with self._course_details_lock:
+            cached = self._course_details.get(slug)
+        
+        if cached and now - cached[0] < COURSE_DETAILS_CACHE_TTL:
+            course_info.update({
+                'course_id': cached[1],
+                'title': cached[2]
+            })
+            return course_info
+        
+        course_info = self._fetch_course_details(course_info)
+        
+        if course_info:
+            with self._course_details_lock:
+                # Drop expired entries before storing the new one
+                self._course_details = {
+                    key: entry for key, entry in self._course_details.items()
+                    if now - entry[0] < COURSE_DETAILS_CACHE_TTL
+                }
+                self._course_details[slug] = (now, course_info['course_id'], course_info['title'])
+        
+        return course_info
+    
+    def _fetch_course_details(self, course_info: Dict) -> Optional[Dict]:
+        """
+        Look up course ID and title, from the course API or the course page.
+        
         Args:
             course_info (dict): Basic course information
             
@@ -281,24 +599,77 @@ class UdemyEnroller:
             dict: Detailed course information
         """
         try:
-            # Get course page to extract course ID and other details
-            response = self.session.get(course_info['url'], timeout=self.timeout)
+            # The course API answers with a few hundred bytes of JSON
+            response = self.session.get(
+                COURSE_API_URL.format(slug=course_info['slug']),
+                params=COURSE_API_PARAMS,
+                timeout=self.timeout
+            )
             
-            if response.status_code != 200:
-                logger.error(f"Failed to load course page: {response.status_code}")
-                return None
+            if response.status_code == 200:
+                data = response.json()
+                if data.get('id'):
+                    course_info.update({
+                        'course_id': str(data['id']),
+                        'title': data.get('title') or course_info['slug']
+                    })
+                    return course_info
+            
+            logger.warning(f"Course API lookup failed ({response.status_code}), reading course page")
+            
+        except Exception as e:
+            logger.warning(f"Course API lookup failed ({e}), reading course page")
+        
+        return self._get_course_details_from_page(course_info)
+    
+    def _get_course_details_from_page(self, course_info: Dict) -> Optional[Dict]:
+        """
+        Get course ID and title from the course page (fallback for the API).
+        
+        Args:
+            course_info (dict): Basic course information
+            
+        Returns:
+            dict: Detailed course information
+        """
+        try:
+            # Get course page to extract course ID and other details; stop
+            # reading as soon as both are found (they are near the top)
+            with self.session.get(course_info['url'], timeout=self.timeout, stream=True) as response:
+                if response.status_code != 200:
+                    logger.error(f"Failed to load course page: {response.status_code}")
+                    return None
+                
+                page = bytearray()
+                course_id_match = title_match = None
+                
+                for chunk in response.iter_content(PAGE_CHUNK_SIZE):
+                    start = max(0, len(page) - PAGE_SEARCH_OVERLAP)
+                    page += chunk
+                    
+                    if not course_id_match:
+                        course_id_match = _CLP_COURSE_ID_PATTERN.search(page, start)
+                    if not title_match:
+                        title_match = _TITLE_PATTERN.search(page, start)
+                    if course_id_match and title_match:
+                        break
+                
+                encoding = response.encoding or 'utf-8'
             
             # Extract course ID from the page
-            course_id_match = re.search(r'"id":(\d+)', response.text)
+            if not course_id_match:
+                course_id_match = _COURSE_ID_PATTERN.search(page)
             if not course_id_match:
                 logger.error("Could not extract course ID from page")
                 return None
             
-            course_id = course_id_match.group(1)
+            course_id = course_id_match.group(1).decode('ascii')
             
             # Extract course title
-            title_match = re.search(r'<title>(.+?)</title>', response.text)
-            title = title_match.group(1) if title_match else course_info['slug']
+            if title_match:
+                title = html.unescape(title_match.group(1).decode(encoding, 'replace'))
+            else:
+                title = course_info['slug']
             
             course_info.update({
                 'course_id': course_id,
@@ -321,39 +692,88 @@ class UdemyEnroller:
         Returns:
             tuple: (success: bool, message: str)
         """
+        success, message, _ = self._submit_enrollment(course_url, verify=True)
+        return success, message
+    
+    def _submit_enrollment(self, course_url: str, verify: bool) -> Tuple[bool, str, Optional[Dict]]:
+        """
+        Enroll in a course, optionally leaving verification to the caller.
+        
+        Args:
+            course_url (str): Udemy course URL with coupon code
+            verify (bool): Verify the enrollment before returning
+            
+        Returns:
+            tuple: (success: bool, message: str, course_info: dict or None).
+                course_info is only set for an unverified submitted enrollment;
+                the caller must then pass it to _finish_enrollment().
+        """
+        slug = None
+        
         try:
             logger.info(f"Attempting to enroll in course: {course_url}")
             
             # Extract course information
-            course_info = self._extract_course_info(course_url)
+            course_info = self._extract_course_info(self._resolve_course_url(course_url))
             if not course_info:
-                return False, "Invalid course URL"
-            
-            # Check if already enrolled
-            if course_info['slug'] in self.enrolled_courses:
-                message = f"Already enrolled in course: {course_info['slug']}"
-                logger.info(message)
-                return True, message
+                return False, "Invalid course URL", None
+            
+            # Check if already enrolled, or being enrolled through another link
+            with self._enrolling_lock:
+                if course_info['slug'] in self.enrolled_courses:
+                    message = f"Already enrolled in course: {course_info['slug']}"
+                    logger.info(message)
+                    return True, message, None
+                
+                if course_info['slug'] in self._enrolling_slugs:
+                    message = f"Skipped: another link for course {course_info['slug']} is being enrolled"
+                    logger.info(message)
+                    return False, message, None
+                
+                slug = course_info['slug']
+                self._enrolling_slugs.add(slug)
             
             # Get detailed course information
             course_info = self._get_course_details(course_info)
             if not course_info:
-                return False, "Failed to get course details"
+                return False, "Failed to get course details", None
             
             # Attempt enrollment
             success, message = self._attempt_enrollment(course_info)
             
-            if success:
-                # Add to enrolled courses set
-                self.enrolled_courses.add(course_info['slug'])
-                logger.info(f"Successfully enrolled in: {course_info['title']}")
+            if not success:
+                return success, message, None
+            
+            if not verify:
+                # The caller finishes (and releases) this enrollment
+                slug = None
+                return success, message, course_info
             
-            return success, message
+            success, message = self._verify_enrollment(course_info)
+            self._finish_enrollment(course_info, success)
+            slug = None
+            
+            return success, message, None
             
         except Exception as e:
             error_msg = f"Error enrolling in course: {e}"
             logger.error(error_msg)
-            return False, error_msg
+            return False, error_msg, None
+        
+        finally:
+            if slug is not None:
+                with self._enrolling_lock:
+                    self._enrolling_slugs.discard(slug)
+    
+    def _finish_enrollment(self, course_info: Dict, success: bool):
+        """Record a verified enrollment and release its in-progress slug."""
+        with self._enrolling_lock:
+            if success:
+                self.enrolled_courses.add(course_info['slug'])
+            self._enrolling_slugs.discard(course_info['slug'])
+        
+        if success:
+            logger.info(f"Successfully enrolled in: {course_info['title']}")
     
     def _attempt_enrollment(self, course_info: Dict) -> Tuple[bool, str]:
         """
@@ -366,19 +786,20 @@ class UdemyEnroller:
             tuple: (success: bool, message: str)
         """
         try:
-            # First, check if the course is free with coupon
-            checkout_url = f"https://www.udemy.com/course/subscribe/?courseId={course_info['course_id']}"
-            
-            # Add coupon code to checkout URL
-            if course_info['coupon_code']:
-                checkout_url += f"&couponCode={course_info['coupon_code']}"
+            # requests encodes the coupon code and drops it when empty
+            params = {
+                'courseId': course_info['course_id'],
+                'couponCode': course_info['coupon_code'] or None
+            }
             
             # Attempt to enroll
-            response = self.session.get(checkout_url, timeout=self.timeout)
+            self._wait_for_rate_limit()
+            response = self.session.get(CHECKOUT_URL, params=params, timeout=self.timeout)
+            self._note_rate_limit(response)
             
             if response.status_code == 200:
-                # Check if enrollment was successful by verifying course subscription
-                return self._verify_enrollment(course_info)
+                # Verified separately, one course or a whole batch at a time
+                return True, f"Enrollment submitted: {course_info['title']}"
             
             elif response.status_code == 404:
                 return False, "Course not found or coupon expired"
@@ -392,6 +813,48 @@ class UdemyEnroller:
         except Exception as e:
             return False, f"Enrollment error: {e}"
     
+    def _wait_for_rate_limit(self):
+        """Sleep until Udemy's rate limit allows the next enrollment request."""
+        with self._rate_limit_lock:
+            delay = self._next_request_at - time.monotonic()
+        
+        if delay > 0:
+            self._stop_event.wait(delay)
+    
+    def _note_rate_limit(self, response: requests.Response):
+        """
+        Schedule the next enrollment request from a response's rate-limit headers.
+        
+        Args:
+            response: Response to an enrollment request
+        """
+        try:
+            retry_after = float(response.headers.get('Retry-After'))
+        except (TypeError, ValueError):
+            retry_after = None
+        
+        with self._rate_limit_lock:
+            if response.status_code == 429:
+                self._rate_limit_backoff = min(
+                    RATE_LIMIT_MAX_DELAY,
+                    self._rate_limit_backoff * 2 or RATE_LIMIT_BASE_DELAY
+                )
+                delay = retry_after if retry_after is not None else random.uniform(
+                    RATE_LIMIT_BASE_DELAY, max(RATE_LIMIT_BASE_DELAY, self._rate_limit_backoff)
+                )
+            else:
+                self._rate_limit_backoff = 0
+                if retry_after is not None:
+                    delay = retry_after
+                elif response.headers.get('X-RateLimit-Remaining') == '0':
+                    delay = RATE_LIMIT_BASE_DELAY
+                else:
+                    return
+            
+            if delay > 0:
+                logger.info(f"Rate limited, pausing enrollments for {delay:.1f}s")
+            self._next_request_at = max(self._next_request_at, time.monotonic() + delay)
+    
     def _verify_enrollment(self, course_info: Dict) -> Tuple[bool, str]:
         """
         Verify if enrollment was successful.
@@ -404,7 +867,7 @@ class UdemyEnroller:
         """
         try:
             # Check if course appears in subscribed courses
-            check_url = f"https://www.udemy.com/api-2.0/users/me/subscribed-courses/{course_info['course_id']}/"
+            check_url = f"{SUBSCRIBED_COURSES_URL}{course_info['course_id']}/"
             params = {
                 'fields[course]': '@default,buyable_object_type,primary_subcategory,is_private'
             }
@@ -427,37 +890,150 @@ class UdemyEnroller:
         except Exception as e:
             return False, f"Verification error: {e}"
     
-    def enroll_in_multiple_courses(self, course_urls: List[str]) -> Dict[str, Dict]:
+    def verify_batch(self, course_ids: List[str]) -> Dict[str, bool]:
+        """
+        Verify several enrollments against the subscribed-courses list.
+        
+        Recent enrollments come first, so only as many pages are read as
+        there are courses to find. A course that was already owned keeps its
+        original enroll time and may not be on those pages, so a False here
+        is not conclusive.
+        
+        Args:
+            course_ids (List[str]): IDs of the courses just enrolled in
+            
+        Returns:
+            dict: Whether each course is subscribed, or an empty dict if the
+                list could not be loaded
+        """
+        remaining = set(course_ids)
+        if not remaining:
+            return {}
+        
+        params = {
+            'ordering': '-enroll_time',
+            'fields[course]': 'id',
+            'page_size': ENROLLED_PAGE_SIZE
+        }
+        
+        try:
+            for page in range(1, -(-len(remaining) // ENROLLED_PAGE_SIZE) + 1):
+                response = self.session.get(
+                    SUBSCRIBED_COURSES_URL,
+                    params={**params, 'page': page},
+                    timeout=self.timeout
+                )
+                
+                if response.status_code != 200:
+                    logger.warning(f"Failed to load subscribed courses for verification: {response.status_code}")
+                    return {}
+                
+                data = response.json()
+                remaining.difference_update(str(course.get('id')) for course in data.get('results', []))
+                
+                if not remaining or not data.get('next'):
+                    break
+            
+        except Exception as e:
+            logger.error(f"Error verifying enrollments: {e}")
+            return {}
+        
+        return {course_id: course_id not in remaining for course_id in course_ids}
+    
+    def stop(self):
+        """
+        Stop a running enroll_in_multiple_courses(): courses not yet started
+        are skipped and rate-limit pauses end early. Used when the app is
+        closing.
+        """
+        self._stop_event.set()
+    
+    def enroll_in_multiple_courses(
+        self,
+        course_urls: List[str],
+        progress_callback: Optional[Callable[[str, Dict], None]] = None,
+        max_concurrency: int = 1
+    ) -> Dict[str, Dict]:
         """
-        Enroll in multiple courses with rate limiting.
+        Enroll in multiple courses, pausing only when Udemy rate-limits.
         
         Args:
             course_urls (List[str]): List of course URLs
+            progress_callback (callable, optional): Called with (course_url, result)
+                after each course is processed; may be called from worker threads.
+                A course whose checkout went through is first reported with
+                'pending': True, then again once the batch is verified
+            max_concurrency (int): Maximum number of enrollments in flight at once.
+                All workers pause together when a response asks them to.
             
         Returns:
             dict: Results for each course
         """
-        results = {}
+        total = len(course_urls)
+        workers = max(1, min(max_concurrency, total))
         
-        logger.info(f"Starting enrollment for {len(course_urls)} courses")
+        logger.info(f"Starting enrollment for {total} courses ({workers} at a time)")
         
-        for i, course_url in enumerate(course_urls, 1):
-            logger.info(f"Processing course {i}/{len(course_urls)}")
+        # Submitted enrollments, verified together once the batch is done
+        submitted = {}
+        
+        def process(item):
+            i, course_url = item
+            if self._stop_event.is_set():
+                return {
+                    'success': False,
+                    'message': "Enrollment stopped"
+                }
+            
+            logger.info(f"Processing course {i}/{total}")
+            
+            success, message, course_info = self._submit_enrollment(course_url, verify=False)
+            result = {
+                'success': success,
+                'message': message
+            }
+            
+            if course_info:
+                submitted[course_url] = course_info
+                result['pending'] = True
+            
+            if progress_callback:
+                progress_callback(course_url, result)
+            
+            return result
+        
+        items = enumerate(course_urls, 1)
+        if workers == 1:
+            outcomes = [process(item) for item in items]
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="enroll") as executor:
+                outcomes = list(executor.map(process, items))
+        
+        results = dict(zip(course_urls, outcomes))
+        
+        verified = self.verify_batch([info['course_id'] for info in submitted.values()])
+        for course_url, course_info in submitted.items():
+            if verified.get(course_info['course_id']):
+                success, message = True, f"Successfully enrolled in: {course_info['title']}"
+            else:
+                # Not among the newest enrollments (a course owned long ago
+                # sorts by its original enroll time) or the list could not be
+                # loaded; check this course on its own
+                success, message = self._verify_enrollment(course_info)
             
-            success, message = self.enroll_in_course(course_url)
+            self._finish_enrollment(course_info, success)
             
             results[course_url] = {
                 'success': success,
                 'message': message
             }
             
-            # Rate limiting - wait between requests
-            if i < len(course_urls):
-                time.sleep(2)
+            if progress_callback:
+                progress_callback(course_url, results[course_url])
         
         # Log summary
         successful = sum(1 for r in results.values() if r['success'])
-        logger.info(f"Enrollment complete: {successful}/{len(course_urls)} successful")
+        logger.info(f"Enrollment complete: {successful}/{total} successful")
         
         return results
     